@@ -0,0 +1,38 @@
+# type: ignore
+"""drop redundant assignment indexes
+
+Revision ID: 8cc13facf11c
+Revises: e775c3bb12d8
+Create Date: 2026-10-16 10:12:44.318209
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8cc13facf11c"
+down_revision: Union[str, None] = "e775c3bb12d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The unique constraint on (entity_type, entity_id, feature) already serves
+    # the assignment lookup, so these only slow down inserts.
+    op.drop_index(op.f("ix_assignment_entity_type"), table_name="assignment")
+    op.drop_index(op.f("ix_assignment_entity_id"), table_name="assignment")
+    op.drop_index(op.f("ix_assignment_feature"), table_name="assignment")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_assignment_feature"), "assignment", ["feature"], unique=False
+    )
+    op.create_index(
+        op.f("ix_assignment_entity_id"), "assignment", ["entity_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_assignment_entity_type"), "assignment", ["entity_type"], unique=False
+    )
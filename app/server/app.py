@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
@@ -12,7 +14,7 @@ from sqlalchemy.exc import SQLAlchemyError
 import alembic.util.exc
 
 from .config import RdbmsConfig, config
-from .db import clear_invalid_revision
+from .db import clear_invalid_revision, warm_up_pool
 from .features import init_gater
 from .generated.main import app as generated_app
 from .meta import meta_router
@@ -87,11 +89,24 @@ async def ensure_db(store: RdbmsConfig) -> DbDriver:
 async def lifespan(api: FastAPI):
     """Setup and teardown logic for the server."""
     logger.info("Starting up ...")
+    # Size the default executor, which is used to offload CPU-heavy work
+    # (like serializing large documents) from the event loop.
+    if config.thread_pool_size:
+        logger.info("Using a thread pool of size %d", config.thread_pool_size)
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=config.thread_pool_size)
+        )
     gater = init_gater()
     api.state.gater = gater
     api.state.startup_time = utcnow()
 
     db = await ensure_db(config.experiments.store)
+    # Connect before the first request so that it doesn't pay for the handshake.
+    # A failure here is not fatal; sessions reconnect on demand.
+    try:
+        await warm_up_pool(db, config.experiments.pool_warmup_connections)
+    except Exception as e:
+        logger.warning("Failed to warm up the database connection pool: %s", e)
 
     async with config.queue.store.driver() as store, config.metrics.driver:
         api.state.queue_store = store
@@ -174,8 +174,9 @@ class ClientCredentialsAuthnDriver(BaseAuthnDriver):
         secret_hash = ph.hash(client_secret)
         client = Client(name=name, secret_hash=secret_hash)
         tx.add(client)
+        # NOTE: The ID is generated client-side, so it's set after the flush
+        # without reading the row back.
         await tx.flush()
-        await tx.refresh(client)
         return NewClientResponse(client_id=client.id.hex, client_secret=client_secret)
 
     async def issue_token(
@@ -1,5 +1,7 @@
 import asyncio
+import functools
 import hashlib
+import inspect
 import logging
 from typing import Any, Callable, Coroutine, NamedTuple, TypeVar, cast, overload
 
@@ -17,6 +19,29 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_TTL = int(config.queue.task.retention_time_seconds)
 
+_HSCAN_BATCH_SIZE = 500
+"""Number of fields to request per batch when scanning large hashes."""
+
+_OFFLOAD_THRESHOLD_BYTES = 256 * 1024
+"""Documents at least this large are (de)serialized off the event loop."""
+
+
+def _is_large_doc(doc: OutputDocument) -> bool:
+    """Check whether a document is large enough to serialize in a thread.
+
+    Args:
+        doc (OutputDocument): The document.
+
+    Returns:
+        bool: Whether the document content exceeds the offload threshold.
+    """
+    content = getattr(doc.root, "content", None)
+    if content is None:
+        return False
+    if isinstance(content, str):
+        return len(content) >= _OFFLOAD_THRESHOLD_BYTES
+    return len(content.original) + len(content.redacted) >= _OFFLOAD_THRESHOLD_BYTES
+
 
 SavedMask = NamedTuple("SavedMask", [("role", str), ("mask", str), ("name", str)])
 """Information about a masked annotation saved in our DB."""
@@ -37,6 +62,8 @@ class MaskInfo:
         """
         self._masks = initial or {}
         self._extra_placeholders = extra_placeholders or {}
+        self._name_mask_cache: NameToMaskMap | None = None
+        self._id_name_cache: IdToNameMap | None = None
 
     def get(self, subject_id: bytes) -> SavedMask:
         """Get the mask info for a subject by ID.
@@ -57,6 +84,8 @@ class MaskInfo:
             mask_info (SavedMask): The mask info.
         """
         self._masks[subject_id] = mask_info
+        self._name_mask_cache = None
+        self._id_name_cache = None
 
     def get_name_mask_map(self) -> NameToMaskMap:
         """Get the map from real names to masks.
@@ -70,11 +99,13 @@ class MaskInfo:
         Returns:
             NameToMaskMap: The map from real names to masks.
         """
-        # Get all the placeholders that have IDs associated with them
-        placeholders = {v.name: v.mask for v in self._masks.values()}
-        # Merge with all the extra placeholders that we're not sure if we have IDs for.
-        placeholders.update(self._extra_placeholders)
-        return NameToMaskMap(placeholders)
+        if self._name_mask_cache is None:
+            # Get all the placeholders that have IDs associated with them
+            placeholders = {v.name: v.mask for v in self._masks.values()}
+            # Merge with the extra placeholders that we're not sure if we have IDs for.
+            placeholders.update(self._extra_placeholders)
+            self._name_mask_cache = NameToMaskMap(placeholders)
+        return self._name_mask_cache
 
     def get_id_name_map(self) -> IdToNameMap:
         """Get the map from subject IDs to real names.
@@ -88,7 +119,11 @@ class MaskInfo:
         Returns:
             IdToNameMap: The map from subject IDs to real names.
         """
-        return IdToNameMap({k.decode(): v.name for k, v in self._masks.items()})
+        if self._id_name_cache is None:
+            self._id_name_cache = IdToNameMap(
+                {k.decode(): v.name for k, v in self._masks.items()}
+            )
+        return self._id_name_cache
 
 
 F_sync = TypeVar("F_sync", bound=Callable[..., Any])
@@ -113,8 +148,9 @@ def ensure_init(func: Any) -> Any:
         The wrapped function.
     """
     # Check if the func is async
-    if hasattr(func, "__await__"):
+    if inspect.iscoroutinefunction(func):
 
+        @functools.wraps(func)
         async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
             if not self.inited:
                 raise ValueError("Case store not initialized")
@@ -123,6 +159,7 @@ def ensure_init(func: Any) -> Any:
         return async_wrapper
     else:
 
+        @functools.wraps(func)
         def sync_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
             if not self.inited:
                 raise ValueError("Case store not initialized")
@@ -132,11 +169,15 @@ def ensure_init(func: Any) -> Any:
 
 
 class CaseStore:
+    __slots__ = ("store", "jurisdiction_id", "case_id", "ttl", "_prefix", "_key_cache")
+
     def __init__(self, store: StoreSession):
         self.store = store
         self.jurisdiction_id = ""
         self.case_id = ""
-        self.expires_at = 0
+        self.ttl = 0
+        self._prefix = ""
+        self._key_cache: dict[str, str] = {}
 
     @property
     def inited(self) -> bool:
@@ -157,10 +198,45 @@ class CaseStore:
             Key under which the data was saved.
         """
         await store.set(key, value)
-        t = await store.time()
-        await store.expire_at(key, t + ttl)
+        await store.expire(key, ttl)
+        return key
+
+    @classmethod
+    async def save_hash(
+        cls,
+        store: StoreSession,
+        key: str,
+        mapping: SimpleMapping,
+        ttl: int = _DEFAULT_TTL,
+    ) -> str:
+        """Save a hash in the store.
+
+        Args:
+            store (StoreSession): The store.
+            key (str): The key.
+            mapping (SimpleMapping): The fields of the hash.
+            ttl (int, optional): The time-to-live in seconds.
+
+        Returns:
+            Key under which the data was saved.
+        """
+        await store.hsetmapping(key, mapping)
+        await store.expire(key, ttl)
         return key
 
+    @classmethod
+    async def get_hash(cls, store: StoreSession, key: str) -> dict[str, str]:
+        """Get a hash from the store.
+
+        Args:
+            store (StoreSession): The store.
+            key (str): The key.
+
+        Returns:
+            dict[str, str]: The fields of the hash, empty if it doesn't exist.
+        """
+        return await store.hgetall_str(key)
+
     @classmethod
     async def get(cls, store: StoreSession, key: str) -> bytes | None:
         """Get a key-value pair from the store.
@@ -207,35 +283,47 @@ class CaseStore:
             return
         self.jurisdiction_id = jurisdiction_id
         self.case_id = case_id
-        self.expires_at = await self._set_expiration(ttl)
-        logger.debug("CaseStore initialized, will expire at %d", self.expires_at)
+        self._prefix = f"{jurisdiction_id}:{case_id}:"
+        self.ttl = ttl
+        await self._set_expiration()
+        logger.debug("CaseStore initialized, will expire in %ds", self.ttl)
 
     @ensure_init
-    async def _set_expiration(self, ttl: int) -> int:
+    async def _set_expiration(self) -> None:
         """Set the expiration time for the case.
 
         Returns:
-            int: The expiration time, as a unix timestamp
+            None
         """
-        expires_at = await self.store.time() + ttl
         k = self.key("expires")
         await self.store.set(k, "")
-        await self.store.expire_at(k, expires_at)
-        return expires_at
+        await self.store.expire(k, self.ttl)
 
     @ensure_init
-    async def get_masked_names(self) -> list[MaskedSubject]:
+    async def get_masked_names(
+        self, subject_ids: list[str] | None = None
+    ) -> list[MaskedSubject]:
         """Get the aliases for a case.
 
+        Args:
+            subject_ids (list[str], optional): Only get aliases for these
+                subjects. By default, aliases for every subject are returned.
+
         Returns:
             list[MaskedSubject]: The masked subjects.
         """
-        masks = await self.store.hgetall(self.key("mask"))
+        if subject_ids is None:
+            masks = await self.store.hgetall_str(self.key("mask"))
+            return [MaskedSubject(subjectId=k, alias=v) for k, v in masks.items()]
+
+        if not subject_ids:
+            return []
+        # Only read the fields we need, rather than the whole hash.
+        values = await self.store.hmget(self.key("mask"), subject_ids)
         return [
-            MaskedSubject(
-                subjectId=k.decode("utf-8"), alias=v.decode("utf-8") if v else ""
-            )
-            for k, v in masks.items()
+            MaskedSubject(subjectId=subject_id, alias=v.decode())
+            for subject_id, v in zip(subject_ids, values, strict=True)
+            if v is not None
         ]
 
     @ensure_init
@@ -262,7 +350,7 @@ class CaseStore:
         simple_masks = masks._map.copy() if isinstance(masks, IdToMaskMap) else masks
         mapping_key = self.key("mask")
         await self.store.hsetmapping(mapping_key, simple_masks)
-        await self.store.expire_at(mapping_key, self.expires_at)
+        await self.store.expire(mapping_key, self.ttl)
 
     @ensure_init
     async def save_placeholders(self, masks: SimpleMapping | NameToMaskMap) -> None:
@@ -279,7 +367,7 @@ class CaseStore:
         simple_masks = masks._map.copy() if isinstance(masks, NameToMaskMap) else masks
         mapping_key = self.key("placeholders")
         await self.store.hsetmapping(mapping_key, simple_masks)
-        await self.store.expire_at(mapping_key, self.expires_at)
+        await self.store.expire(mapping_key, self.ttl)
 
     @ensure_init
     async def save_result_doc(self, doc_id: str, doc: OutputDocument) -> None:
@@ -293,9 +381,14 @@ class CaseStore:
             None
         """
         k = self.key("result:" + doc_id)
-        serialized_doc = doc.model_dump_json()
+        # Serializing a big document can stall the event loop, so do it in a
+        # worker thread. Small documents aren't worth the thread hand-off.
+        if _is_large_doc(doc):
+            serialized_doc = await asyncio.to_thread(doc.model_dump_json)
+        else:
+            serialized_doc = doc.model_dump_json()
         await self.store.set(k, serialized_doc)
-        await self.store.expire_at(k, self.expires_at)
+        await self.store.expire(k, self.ttl)
 
     @ensure_init
     async def get_result_doc(self, doc_id: str) -> OutputDocument | None:
@@ -308,6 +401,10 @@ class CaseStore:
         serialized_doc = await self.store.get(k)
         if not serialized_doc:
             return None
+        if len(serialized_doc) >= _OFFLOAD_THRESHOLD_BYTES:
+            return await asyncio.to_thread(
+                OutputDocument.model_validate_json, serialized_doc
+            )
         return OutputDocument.model_validate_json(serialized_doc)
 
     @ensure_init
@@ -329,7 +426,7 @@ class CaseStore:
         srm = cast(SimpleMapping, subject_role_mapping)
         k = self.key("role")
         await self.store.hsetmapping(k, srm)
-        await self.store.expire_at(k, self.expires_at)
+        await self.store.expire(k, self.ttl)
 
     @ensure_init
     async def get_mask_info(self) -> MaskInfo:
@@ -359,21 +456,18 @@ class CaseStore:
         id_to_role, id_to_mask, name_to_mask = await asyncio.gather(
             self.store.hgetall(self.key("role")),
             self.store.hgetall(self.key("mask")),
-            self.store.hgetall(self.key("placeholders")),
+            self.store.hgetall_str(self.key("placeholders")),
         )
         # Every subject ID in the case that we are tracking, e.g.:
         # ["1", "2"]
         all_ids_list = list(id_to_role.keys() | id_to_mask.keys())
         # The primary name for each subject ID, e.g.:
         # ["John Doe", "Jane Doe"]
-        all_names_list = await asyncio.gather(
-            *[
-                self.store.getmodel(
-                    HumanName, self.key(f"aliases:{subject_id.decode()}:primary")
-                )
-                for subject_id in all_ids_list
-            ]
-        )
+        primary_name_keys = [
+            f"{self._prefix}aliases:{subject_id.decode()}:primary"
+            for subject_id in all_ids_list
+        ]
+        all_names_list = await self.store.mget_models(HumanName, primary_name_keys)
         # Map from subject ID to real primary name, e.g.:
         # {"1": "John Doe", "2": "Jane Doe"}
         id_to_real_name = {
@@ -384,12 +478,12 @@ class CaseStore:
         # The subject IDs that we know about roles but don't have masks for yet.
         ids_missing_masks = id_to_role.keys() - id_to_mask.keys()
 
+        # Decode roles and masks once up front, since they're used repeatedly below.
+        role_str = {k: v.decode() for k, v in id_to_role.items()}
+        mask_str = {k: v.decode() for k, v in id_to_mask.items()}
+
         # Decode extra placeholders
-        extra_placeholders = (
-            {k.decode(): v.decode() for k, v in name_to_mask.items() if k and v}
-            if name_to_mask
-            else {}
-        )
+        extra_placeholders = {k: v for k, v in name_to_mask.items() if k and v}
 
         # Start generating final metadata, e.g.:
         # MaskInfo({
@@ -402,10 +496,10 @@ class CaseStore:
             {
                 k: SavedMask(
                     name=id_to_real_name.get(k, ""),
-                    role=id_to_role.get(k, b"").decode(),
-                    mask=id_to_mask.get(k, b"").decode(),
+                    role=role_str.get(k, ""),
+                    mask=mask,
                 )
-                for k in id_to_mask.keys()
+                for k, mask in mask_str.items()
                 if k in id_to_real_name
             },
             extra_placeholders=extra_placeholders,
@@ -413,7 +507,7 @@ class CaseStore:
 
         # Next, create a RoleEnumerator so that we can generate masks for everyone else.
         try:
-            role_enumerator = RoleEnumerator(v.decode() for v in id_to_mask.values())
+            role_enumerator = RoleEnumerator(list(mask_str.values()))
         except ValueError as e:
             logger.error("Error initializing RoleEnumerator: %s", e)
             role_enumerator = RoleEnumerator()
@@ -421,12 +515,13 @@ class CaseStore:
         # Generate masks for the remaining IDs.
         for subject_id in ids_missing_masks:
             real_name = id_to_real_name.get(subject_id, "")
-            mask = role_enumerator.next_mask(id_to_role[subject_id].decode())
+            role = role_str[subject_id]
+            mask = role_enumerator.next_mask(role)
             metadata.set(
                 subject_id,
                 SavedMask(
                     name=real_name,
-                    role=id_to_role[subject_id].decode(),
+                    role=role,
                     mask=mask,
                 ),
             )
@@ -440,8 +535,14 @@ class CaseStore:
         Returns:
             dict[str, list[str]]: The chain of tasks for each document.
         """
-        result = await self.store.hgetall(self.key("task"))
-        return {k.decode(): v.decode().split(",") for k, v in result.items()}
+        result = dict[str, list[str]]()
+        # Scan the hash in batches rather than with one big HGETALL, so that
+        # cases with many documents don't block redis for the whole read.
+        async for k, v in self.store.hscan_iter(
+            self.key("task"), count=_HSCAN_BATCH_SIZE
+        ):
+            result[k.decode()] = v.decode().split(",")
+        return result
 
     @ensure_init
     async def save_doc_task(self, doc_id: str, task: AsyncResult) -> None:
@@ -454,19 +555,38 @@ class CaseStore:
         Returns:
             None
         """
+        await self.save_doc_tasks({doc_id: task})
+
+    @ensure_init
+    async def save_doc_tasks(self, tasks: dict[str, AsyncResult]) -> None:
+        """Save the task IDs for several documents at once.
+
+        All documents are written with a single HSET.
+
+        Args:
+            tasks (dict[str, AsyncResult]): The task result promise for each
+                document ID.
+
+        Returns:
+            None
+        """
+        if not tasks:
+            return
         k = self.key("task")
-        task_ids = list[str]()
-        # Flatten the list of task IDs from the result chain
-        node = task
-        while node:
-            task_ids.insert(0, node.id)
-            node = node.parent
-
-        await self.store.hsetmapping(
-            k,
-            {doc_id: ",".join(task_ids)},
-        )
-        await self.store.expire_at(k, self.expires_at)
+        mapping = dict[str, str]()
+        for doc_id, task in tasks.items():
+            task_ids = list[str]()
+            # Flatten the list of task IDs from the result chain.
+            # The chain is walked from the tail, so reverse at the end.
+            node = task
+            while node:
+                task_ids.append(node.id)
+                node = node.parent
+            task_ids.reverse()
+            mapping[doc_id] = ",".join(task_ids)
+
+        await self.store.hsetmapping(k, cast(SimpleMapping, mapping))
+        await self.store.expire(k, self.ttl)
 
     @ensure_init
     async def save_objects_list(self, objects: list[RedactionTarget]) -> None:
@@ -479,9 +599,9 @@ class CaseStore:
             None
         """
         k = self.key("objects")
-        for obj in objects:
-            await self.store.enqueue_model(k, obj)
-        await self.store.expire_at(k, self.expires_at)
+        # Push every object with one LPUSH rather than one command per object.
+        await self.store.enqueue_models(k, objects)
+        await self.store.expire(k, self.ttl)
 
     @ensure_init
     async def pop_object(self) -> RedactionTarget | None:
@@ -508,15 +628,15 @@ class CaseStore:
         Returns:
             None
         """
-        subject_key = f"aliases:{subject_id}"
+        subject_key = self.key(f"aliases:{subject_id}")
 
         if primary:
-            k = self.key(f"{subject_key}:primary")
+            k = f"{subject_key}:primary"
             await self.store.setmodel(k, alias)
-            await self.store.expire_at(k, self.expires_at)
+            await self.store.expire(k, self.ttl)
 
-        await self.store.saddmodel(self.key(subject_key), alias)
-        await self.store.expire_at(self.key(subject_key), self.expires_at)
+        await self.store.saddmodel(subject_key, alias)
+        await self.store.expire(subject_key, self.ttl)
 
     @ensure_init
     def key(self, category: str) -> str:
@@ -528,4 +648,7 @@ class CaseStore:
         Returns:
             str: The key.
         """
-        return f"{self.jurisdiction_id}:{self.case_id}:{category}"
+        key = self._key_cache.get(category)
+        if key is None:
+            key = self._key_cache[category] = self._prefix + category
+        return key
@@ -1,13 +1,149 @@
 import asyncio
-import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import Any, Awaitable, Callable, TypeVar
 
 from billiard.einfo import ExceptionInfo
 from celery.result import AsyncResult
 
 from .case import CaseStore
 from .config import config
+from .store import Store, StoreSession
+
+T = TypeVar("T")
+
+
+class _StoreLoop:
+    """A persistent event loop and store driver for synchronous callers.
+
+    Celery tasks run synchronously, so they need an event loop to talk to the
+    store. Creating a fresh loop and connection pool with `asyncio.run` on
+    every call is expensive, so instead we keep one loop running in a daemon
+    thread and reuse a single store driver on it.
+
+    The loop is created lazily, and is re-created after a fork, so it is safe
+    to use from pre-forked worker processes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._store: Store | None = None
+        self._store_config: Any = None
+        self._store_lock: asyncio.Lock | None = None
+        self._store_users = dict[Store, int]()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop, starting it if necessary."""
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                if config.thread_pool_size:
+                    loop.set_default_executor(
+                        ThreadPoolExecutor(max_workers=config.thread_pool_size)
+                    )
+                thread = threading.Thread(
+                    target=loop.run_forever, name="store-loop", daemon=True
+                )
+                thread.start()
+                self._loop = loop
+                self._pid = os.getpid()
+                self._store = None
+                self._store_config = None
+                self._store_lock = None
+                self._store_users = dict[Store, int]()
+            return self._loop
+
+    async def _acquire_store(self) -> Store:
+        """Get the store driver, (re-)initializing it if the config changed.
+
+        Every call must be paired with `_release_store`.
+
+        Returns:
+            Store: The current store driver.
+        """
+        # NOTE: Created here so that the lock belongs to the background loop.
+        if self._store_lock is None:
+            self._store_lock = asyncio.Lock()
+        async with self._store_lock:
+            store_config = config.queue.store
+            if self._store is None or self._store_config is not store_config:
+                old_store = self._store
+                store = store_config.driver()
+                await store.init()
+                self._store = store
+                self._store_config = store_config
+                self._store_users[store] = 0
+                if old_store is not None and not self._store_users[old_store]:
+                    del self._store_users[old_store]
+                    await old_store.close()
+            self._store_users[self._store] += 1
+            return self._store
+
+    async def _release_store(self, store: Store) -> None:
+        """Release a store driver obtained from `_acquire_store`.
+
+        A driver that has been replaced is closed once its last user is done.
+
+        Args:
+            store (Store): The store driver.
+        """
+        self._store_users[store] -= 1
+        if store is not self._store and not self._store_users[store]:
+            del self._store_users[store]
+            await store.close()
+
+    def start(self) -> None:
+        """Start the background event loop ahead of the first call."""
+        self._get_loop()
+
+    def run(self, fn: Callable[[StoreSession], Awaitable[T]]) -> T:
+        """Run `fn` in a store transaction and wait for the result.
+
+        Args:
+            fn: A coroutine function that takes a store session.
+
+        Returns:
+            The result of `fn`.
+        """
+
+        async def _run() -> T:
+            store = await self._acquire_store()
+            try:
+                async with store.tx() as tx:
+                    return await fn(tx)
+            finally:
+                await self._release_store(store)
+
+        return asyncio.run_coroutine_threadsafe(_run(), self._get_loop()).result()
+
+
+_store_loop = _StoreLoop()
+
+
+def start_store_loop() -> None:
+    """Start the background event loop used by the synchronous helpers.
+
+    The loop is started lazily anyway, but worker processes call this when
+    they boot so that the first task doesn't pay for it.
+    """
+    _store_loop.start()
+
+
+def run_with_store_sync(fn: Callable[[StoreSession], Awaitable[T]]) -> T:
+    """Run a coroutine function in a store transaction from synchronous code.
+
+    Args:
+        fn: A coroutine function that takes a store session.
+
+    Returns:
+        The result of `fn`.
+    """
+    return _store_loop.run(fn)
 
 
 def get_document_sync(file_storage_id: str | None) -> bytes:
@@ -22,12 +158,10 @@ def get_document_sync(file_storage_id: str | None) -> bytes:
     if not file_storage_id:
         return b""
 
-    async def _get():
-        async with config.queue.store.driver() as store:
-            async with store.tx() as tx:
-                return await CaseStore.get(tx, file_storage_id)
+    async def _get(tx: StoreSession) -> bytes | None:
+        return await CaseStore.get(tx, file_storage_id)
 
-    return asyncio.run(_get())
+    return _store_loop.run(_get) or b""
 
 
 def save_document_sync(file_bytes: bytes) -> str:
@@ -40,12 +174,10 @@ def save_document_sync(file_bytes: bytes) -> str:
         ID in the store where the content was saved.
     """
 
-    async def _save():
-        async with config.queue.store.driver() as store:
-            async with store.tx() as tx:
-                return await CaseStore.save_blob(tx, file_bytes)
+    async def _save(tx: StoreSession) -> str:
+        return await CaseStore.save_blob(tx, file_bytes)
 
-    return asyncio.run(_save())
+    return _store_loop.run(_save)
 
 
 def save_retry_state_sync(
@@ -58,42 +190,55 @@ def save_retry_state_sync(
 ) -> None:
     """Store the retry state in the results store."""
 
-    async def _store():
-        async with config.queue.store.driver() as store:
-            async with store.tx() as tx:
-                ts = await tx.time()
-                dt = datetime.fromtimestamp(ts, tz=UTC)
-                data = json.dumps(
-                    {
-                        "name": self.name,
-                        "exception": str(exc),
-                        "attempts": self.request.retries + 1,
-                        "max_attempts": self.max_retries + 1,
-                        "last_failure": dt.isoformat(),
-                    }
-                )
-                await CaseStore.save_key(tx, f"{task_id}:retry", data.encode("utf-8"))
+    async def _store(tx: StoreSession) -> None:
+        ts = await tx.time()
+        dt = datetime.fromtimestamp(ts, tz=UTC)
+        await CaseStore.save_hash(
+            tx,
+            f"{task_id}:retry",
+            {
+                "name": self.name,
+                "exception": str(exc),
+                "attempts": self.request.retries + 1,
+                "max_attempts": self.max_retries + 1,
+                "last_failure": dt.isoformat(),
+            },
+        )
+
+    _store_loop.run(_store)
+
 
-    asyncio.run(_store())
+async def get_retry_state(tx: StoreSession, task_id: str) -> dict[str, str] | None:
+    """Get the retry state from the results store.
 
+    Args:
+        tx: The store session to read from.
+        task_id: The ID of the task.
 
-async def get_retry_state(task_id: str) -> str | None:
-    """Get the retry state from the results store."""
-    async with config.queue.store.driver() as store:
-        async with store.tx() as tx:
-            s = await CaseStore.get(tx, f"{task_id}:retry")
-            if s:
-                return s.decode("utf-8")
-            return None
+    Returns:
+        dict[str, str] | None: The retry state, if the task has been retried.
+    """
+    state = await CaseStore.get_hash(tx, f"{task_id}:retry")
+    return state or None
 
 
-@dataclass
+@dataclass(slots=True)
 class StateSummary:
     simple_state: str
     dominant_task_name: str
     result: AsyncResult
 
 
+_STATE_RANK = {
+    "FAILURE": 5,
+    "RETRY": 4,
+    "STARTED": 3,
+    "PENDING": 2,
+    "SUCCESS": 0,
+}
+"""Relative priority of Celery task states. Unlisted states rank as 1."""
+
+
 def _inspect_celery_state(result: AsyncResult) -> int:
     """Determine relative priority of a task result state.
 
@@ -103,18 +248,7 @@ def _inspect_celery_state(result: AsyncResult) -> int:
     Returns:
         int: The significance of the state.
     """
-    if result.state == "FAILURE":
-        return 5
-    elif result.state == "RETRY":
-        return 4
-    elif result.state == "STARTED":
-        return 3
-    elif result.state == "PENDING":
-        return 2
-    elif result.state != "SUCCESS":
-        return 1
-    else:  # SUCCESS
-        return 0
+    return _STATE_RANK.get(result.state, 1)
 
 
 def summarize_state(task_results: list[AsyncResult]) -> StateSummary:
@@ -126,15 +260,8 @@ def summarize_state(task_results: list[AsyncResult]) -> StateSummary:
     Returns:
         StateSummary: The summary.
     """
-    simple_state = "UNKNOWN"
-    max_significance = -1
-    dominant_task_name = "<unknown>"
-    result = None
-    for tr in task_results:
-        significance = _inspect_celery_state(tr)
-        if significance > max_significance:
-            max_significance = significance
-            simple_state = tr.state
-            dominant_task_name = tr.name
-            result = tr
-    return StateSummary(simple_state, dominant_task_name, result)
+    # NOTE: `max` returns the first of any equally significant results.
+    dominant = max(task_results, key=_inspect_celery_state, default=None)
+    if dominant is None:
+        return StateSummary("UNKNOWN", "<unknown>", None)
+    return StateSummary(dominant.state, dominant.name, dominant)
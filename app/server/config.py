@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import tomllib
@@ -7,7 +8,7 @@ from typing import Annotated, Union
 from bc2 import AnyProcessingConfig
 from bc2.lib.embedding import EmbeddingConfig
 from glowplug import SqliteSettings
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt
 from pydantic_settings import BaseSettings
 
 from .authn import AuthnConfig, NoAuthnConfig
@@ -46,9 +47,13 @@ class InlineProcessorConfig(BaseModel):
 
 
 class ExternalProcessorConfig(BaseModel):
-    """Load the pipeline from a file or an environment variable."""
+    """Load the pipeline from a file or an environment variable.
 
-    @property
+    The pipeline is parsed the first time it's accessed and cached after that.
+    Call `reload` to pick up changes to the underlying file or variable.
+    """
+
+    @functools.cached_property
     def pipe(self) -> list[AnyProcessingConfig]:
         pipe_string = self._load_pipe_string()
         try:
@@ -57,6 +62,10 @@ class ExternalProcessorConfig(BaseModel):
         except Exception as e:
             raise ValueError("Invalid pipeline configuration") from e
 
+    def reload(self) -> None:
+        """Discard the cached pipeline so it's loaded again on next access."""
+        self.__dict__.pop("pipe", None)
+
     def _load_pipe_string(self) -> str:
         raise NotImplementedError("Subclasses must implement this method.")
 
@@ -99,6 +108,10 @@ class ExperimentsConfig(BaseModel):
     automigrate: Annotated[bool, Field(deprecated=True)] = True
     store: RdbmsConfig = SqliteSettings(engine="sqlite")
     config_reload_interval: float = 30.0
+    # Number of database connections to open at startup, so that the first
+    # requests don't pay for connecting. The default matches SQLAlchemy's default
+    # pool size; set it to 0 to skip the warm-up.
+    pool_warmup_connections: NonNegativeInt = 5
     embedding: EmbeddingConfig | None = None
 
 
@@ -118,6 +131,9 @@ class RedactionParamsConfig(BaseModel):
 
 class Config(BaseSettings):
     debug: bool = False
+    # Number of threads used to offload CPU-heavy work (like serializing large
+    # documents) from the event loop. By default, Python picks the size.
+    thread_pool_size: PositiveInt | None = None
     queue: QueueConfig = QueueConfig()
     experiments: ExperimentsConfig = ExperimentsConfig()
     metrics: MetricsConfig = NoMetricsConfig()
@@ -126,15 +142,33 @@ class Config(BaseSettings):
     params: RedactionParamsConfig = RedactionParamsConfig()
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Read and parse a TOML config file.
+
+    The result is cached, keyed on the file's modification time and size, so
+    that reloading an unchanged file doesn't parse it again.
+
+    Args:
+        path (str): The path to the file.
+        mtime_ns (int): The file's modification time, in nanoseconds.
+        size (int): The file's size, in bytes.
+
+    Returns:
+        dict: The parsed TOML.
+    """
+    return tomllib.loads(Path(path).read_text())
+
+
 def _load_config(path: str = os.getenv("CONFIG_PATH", "config.toml")) -> Config:
     """Load the configuration from a TOML file."""
-    if not Path(path).exists():
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
         logger.warning(f"Config file not found: {path}")
         return Config(processor=InlineProcessorConfig(pipe=[]))
-    else:
-        logger.info(f"Loading config file: {path}")
-    raw_cfg = Path(path).read_text()
-    cfg = tomllib.loads(raw_cfg)
+    logger.info(f"Loading config file: {path}")
+    cfg = _parse_config_file(path, stat.st_mtime_ns, stat.st_size)
     return Config.model_validate(cfg)
 
 
@@ -159,7 +193,7 @@ logging.basicConfig(level=logging.WARNING)
 # Set log level for any loggers that have been instantiated before this point.
 # Most loggers should be set to WARNING, but some should be set to INFO or DEBUG.
 _logger_names = ["root"] + list(logging.root.manager.loggerDict.keys())
-_loud_logger_names = [
+_loud_logger_names = (
     "uvicorn",
     "fastapi",
     "app.",
@@ -168,14 +202,16 @@ _loud_logger_names = [
     "celery",
     "alligater",
     "bc2",
-]
+)
 for name in _logger_names:
-    for loud_name in _loud_logger_names:
-        if name.startswith(loud_name):
-            logging.getLogger(name).setLevel(_log_level)
-            break
-    else:
-        logging.getLogger(name).setLevel(logging.WARNING)
+    _logger = logging.getLogger(name)
+    _target_level = (
+        _log_level if name.startswith(_loud_logger_names) else logging.WARNING
+    )
+    # NOTE: `setLevel` takes the logging module's lock and clears every
+    # logger's cache, so skip it when the level is already right.
+    if _logger.level != _target_level:
+        _logger.setLevel(_target_level)
 
 # Apply some custom filtering to uvicorn's logs.
 improve_uvicorn_access_logs()
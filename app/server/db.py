@@ -1,11 +1,13 @@
+import asyncio
 import logging
+from contextlib import AsyncExitStack
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional, Type, TypeVar, Union
 
 from bc2.lib.embedding import Embedding
 from glowplug import DbDriver, MsSqlSettings, SqliteSettings
-from sqlalchemy import Dialect, ForeignKey, delete, select
+from sqlalchemy import Dialect, ForeignKey, Select, bindparam, delete, select
 from sqlalchemy import text as sql_text
 from sqlalchemy.ext.asyncio import AsyncAttrs, AsyncSession
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -118,14 +120,13 @@ class UUID7Type(TypeDecorator):
 
     def process_bind_param(self, value: Any | None, dialect: Dialect) -> bytes | None:
         """Convert a UUID to bytes."""
-        if value is None:
-            return None
-        if isinstance(value, str):
-            return UUID(value).bytes
-        elif isinstance(value, UUID):
+        # NOTE: Checks are ordered by how often each type is bound.
+        if isinstance(value, UUID):
             return value.bytes
         elif isinstance(value, bytes):
             return value
+        elif isinstance(value, str):
+            return UUID(value).bytes
         return value
 
     def process_result_value(self, value: Any | None, dialect: Dialect) -> UUID | None:
@@ -135,15 +136,25 @@ class UUID7Type(TypeDecorator):
         if isinstance(value, str):
             return UUID(value)
         elif isinstance(value, bytes):
-            return UUID(value.hex())
+            return UUID(bytes=value)
         return value
 
 
 def primary_key() -> UUID:
-    """Generate a UUIDv7 primary key."""
+    """Generate a UUIDv7 primary key.
+
+    UUIDv7s start with a millisecond timestamp, so their byte form sorts in
+    creation order. Stored as BINARY(16), new rows are appended to the end of
+    the primary key index instead of splitting pages at random.
+    """
     return uuid7()
 
 
+# NOTE: Loader strategy rule of thumb for relationships: joined-load scalars,
+# selectin-load collections. Joining a collection repeats every parent column
+# once per child row; `selectin` fetches the children with one extra `IN` query.
+
+
 class Base(AsyncAttrs, DeclarativeBase):
     id: Mapped[UUID]
 
@@ -168,11 +179,32 @@ class Base(AsyncAttrs, DeclarativeBase):
         cls: Type[BaseT], session: AsyncSession, id: UUID
     ) -> Optional[BaseT]:
         """Get a record by its ID."""
-        q = select(cls).filter(cls.id == id)
-        result = await session.execute(q)
+        result = await session.execute(_get_by_id_stmt(cls), {"id": id})
         return result.scalar_one_or_none()
 
 
+_get_by_id_stmts = dict[type, Select]()
+"""Cached `get_by_id` statements for each model."""
+
+
+def _get_by_id_stmt(cls: Type[BaseT]) -> Select[tuple[BaseT]]:
+    """Build the statement to look up a record by ID.
+
+    The statement is built once per model, with the ID as a bound parameter,
+    so repeated lookups only bind the new value.
+
+    Args:
+        cls (Type[BaseT]): The model class.
+
+    Returns:
+        Select[tuple[BaseT]]: The lookup statement.
+    """
+    stmt = _get_by_id_stmts.get(cls)
+    if stmt is None:
+        stmt = _get_by_id_stmts[cls] = select(cls).where(cls.id == bindparam("id"))
+    return stmt
+
+
 class Gater(Base):
     __tablename__ = "gater"
 
@@ -192,9 +224,11 @@ class Assignment(Base):
     __table_args__ = (UniqueConstraint("entity_type", "entity_id", "feature"),)
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=primary_key)
-    entity_type: Mapped[str_256] = mapped_column(index=True)
-    entity_id: Mapped[str_4096] = mapped_column(index=True)
-    feature: Mapped[str_256] = mapped_column(index=True)
+    # NOTE: Lookups filter on all three of these, which the unique constraint
+    # above already indexes. Don't add single-column indexes for them.
+    entity_type: Mapped[str_256] = mapped_column()
+    entity_id: Mapped[str_4096] = mapped_column()
+    feature: Mapped[str_256] = mapped_column()
     variant: Mapped[str_256] = mapped_column(index=True)
     value: Mapped[text] = mapped_column()
     ts: Mapped[datetime] = mapped_column()
@@ -235,7 +269,7 @@ class Outcome(Base):
         back_populates="outcome",
         cascade="all, delete-orphan",
         uselist=True,
-        lazy="joined",
+        lazy="selectin",
     )
     additional_evidence: Mapped[text] = mapped_column(nullable=True)
     page_open_ts: Mapped[datetime] = mapped_column()
@@ -249,7 +283,11 @@ class OutcomeDisqualifiers(Base):
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=primary_key)
     outcome_id: Mapped[UUID] = mapped_column(ForeignKey("outcome.id"))
-    outcome: Mapped[Outcome] = relationship("Outcome", back_populates="disqualifiers")
+    # NOTE: Nothing reads the parent through this side, so refuse to lazy-load it.
+    # It is still filled from the identity map when loaded with the outcome.
+    outcome: Mapped[Outcome] = relationship(
+        "Outcome", back_populates="disqualifiers", lazy="raise_on_sql"
+    )
     disqualifier: Mapped[Disqualifier] = mapped_column()
     created_at: Mapped[datetime] = mapped_column(default=utcnow)
     updated_at: Mapped[datetime] = mapped_column(default=utcnow, onupdate=utcnow)
@@ -276,7 +314,9 @@ class DocumentEmbedding(Base):
     case_id: Mapped[str_256] = mapped_column()
     subject_id: Mapped[str_256] = mapped_column(nullable=True)
     document_id: Mapped[str_256] = mapped_column()
-    embedding: Mapped[Embedding] = mapped_column()
+    # NOTE: The vector is by far the largest column, and most queries only need
+    # the metadata, so it's only loaded when it's accessed.
+    embedding: Mapped[Embedding] = mapped_column(deferred=True)
     dimensions: Mapped[int] = mapped_column()
     model_vendor: Mapped[str_256] = mapped_column()
     model_name: Mapped[str_256] = mapped_column()
@@ -313,9 +353,10 @@ class Revocation(Base):
         Returns:
             bool: Whether the token has been revoked.
         """
-        q = select(cls).filter(cls.id == bytes.fromhex(token_id))
-        result = await session.execute(q)
-        return result.scalar_one_or_none() is not None
+        result = await session.execute(
+            _revocation_check_stmt, {"id": bytes.fromhex(token_id)}
+        )
+        return result.first() is not None
 
     @classmethod
     async def revoke(
@@ -323,6 +364,8 @@ class Revocation(Base):
     ) -> None:
         """Revoke a token given its JTI.
 
+        The row is flushed but not committed; the caller owns the transaction.
+
         Args:
             session (AsyncSession): The database session.
             token_id (str): The JTI of the token, as a hex-string.
@@ -330,7 +373,7 @@ class Revocation(Base):
         """
         r = cls(id=bytes.fromhex(token_id), expires_at=expires_at)
         session.add(r)
-        await session.commit()
+        await session.flush()
 
     @classmethod
     async def vacuum(cls, session: AsyncSession, now: NowFn = utcnow) -> None:
@@ -344,6 +387,13 @@ class Revocation(Base):
         await session.commit()
 
 
+# NOTE: The check runs on every authenticated request. It only needs to know
+# whether the key exists, so it selects just the key (an index-only seek) and
+# the statement is built once. (MS SQL has no `SELECT EXISTS (...)`.)
+_revocation_check_stmt = select(Revocation.id).where(Revocation.id == bindparam("id"))
+"""Statement to check whether a token ID has been revoked."""
+
+
 async def init_db(driver: DbDriver, drop_first: bool = False) -> None:
     """Initialize the database and its tables.
 
@@ -365,6 +415,26 @@ async def init_db(driver: DbDriver, drop_first: bool = False) -> None:
     await driver.init(Base, drop_first=drop_first)
 
 
+async def warm_up_pool(driver: DbDriver, connections: int) -> None:
+    """Open database connections ahead of the first request.
+
+    Uses the same session arguments as the request middleware, so that the
+    connections are checked into the pool that requests draw from. All of the
+    sessions stay open until every one has connected, so each checks out its
+    own connection instead of reusing one that was just returned.
+
+    Args:
+        driver (DbDriver): The database driver.
+        connections (int): How many connections to open.
+    """
+    make_session = driver.async_session_with_args(pool_pre_ping=True)
+    async with AsyncExitStack() as stack:
+        sessions = [
+            await stack.enter_async_context(make_session()) for _ in range(connections)
+        ]
+        await asyncio.gather(*(s.execute(sql_text("SELECT 1")) for s in sessions))
+
+
 def clear_invalid_revision(driver: DbDriver) -> None:
     """Clear the invalid revision from the database.
 
@@ -1,7 +1,14 @@
+import functools
 import re
 from collections import defaultdict
 from typing import Iterable
 
+_MASK_RE = re.compile(r"(.+?)\s+(\d+)$")
+"""Matches a mask, capturing its role and count."""
+
+_WHITESPACE_RE = re.compile(r"\s+")
+"""Matches runs of whitespace."""
+
 
 class RoleEnumerator:
     def __init__(self, masks: Iterable[str] | None = None):
@@ -48,7 +55,7 @@ class RoleEnumerator:
         Returns:
             tuple[str, int]: The role and count.
         """
-        match = re.match(r"(.+?)\s+(\d+)$", mask)
+        match = _MASK_RE.match(mask)
         if not match:
             raise ValueError(f"Invalid mask: {mask}")
         return match.group(1), int(match.group(2))
@@ -71,11 +78,14 @@ class RoleEnumerator:
         self._counters[key] += 1
         return f"{label} {self._counters[key]}"
 
-    def _key_from_role(self, role: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _key_from_role(role: str) -> str:
         """Normalize a role into a key for the counter.
 
         Should gloss over minor differences in role names, like case
-        and whitespace.
+        and whitespace. Roles come from a small vocabulary, so results
+        are cached.
 
         Args:
             role (str): The role.
@@ -83,12 +93,15 @@ class RoleEnumerator:
         Returns:
             str: The key.
         """
-        return re.sub(r"\s+", "", role.lower())
+        return _WHITESPACE_RE.sub("", role.lower())
 
-    def _label_from_role(self, role: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _label_from_role(role: str) -> str:
         """Normalize a role into a label for the mask.
 
         Should normalize the role name into a human readable label.
+        Cached, like `_key_from_role`.
 
         Args:
             role (str): The role.
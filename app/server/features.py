@@ -13,12 +13,32 @@ from alligater import (
 )
 from alligater.feature import ExistingAssignment
 from crocodsl import parse
+from sqlalchemy import bindparam, select
 
 from .config import config
 from .db import Assignment, Gater
 
 logger = logging.getLogger(__name__)
 
+# NOTE: Sticky lookups happen on every gated request, so the statement is built
+# once and only the parameters change between calls. It selects just the columns
+# the lookup returns, which skips building an ORM object for each row.
+_assignment_stmt = select(Assignment.variant, Assignment.value, Assignment.ts).where(
+    Assignment.entity_type == bindparam("entity_type"),
+    Assignment.entity_id == bindparam("entity_id"),
+    Assignment.feature == bindparam("feature"),
+)
+"""Statement to look up an existing assignment."""
+
+_active_version_stmt = select(Gater.id, Gater.updated_at).where(Gater.active)
+"""Statement to look up which config is active, without its blob."""
+
+_config_blob_stmt = select(Gater.blob).where(Gater.id == bindparam("id"))
+"""Statement to fetch a config's blob."""
+
+_config_cache = dict[tuple, str]()
+"""The last config blob loaded, keyed by its ID and update time."""
+
 
 class AnyEntity(Protocol):
     @property
@@ -41,21 +61,18 @@ def _get_assignment(feature: Feature, entity: AnyEntity) -> ExistingAssignment:
     with session.begin() as tx:
         try:
             logger.debug(f"Fetching assignment for {entity}")
-            assignment = (
-                tx.query(Assignment)
-                .filter(
-                    Assignment.entity_type == type(entity).__name__,
-                    Assignment.entity_id == entity.id,
-                    Assignment.feature == feature.name,
-                )
-                .one_or_none()
-            )
+            assignment = tx.execute(
+                _assignment_stmt,
+                {
+                    "entity_type": type(entity).__name__,
+                    "entity_id": entity.id,
+                    "feature": feature.name,
+                },
+            ).one_or_none()
             if assignment:
-                logger.debug(
-                    f"Found assignment for {entity}: "
-                    f"{assignment.variant} -> {assignment.value}"
-                )
-                return assignment.variant, assignment.value, assignment.ts
+                variant, value, ts = assignment
+                logger.debug(f"Found assignment for {entity}: {variant} -> {value}")
+                return variant, value, ts
         except Exception as e:
             logger.error(f"Failed to fetch assignment: {e}")
 
@@ -102,14 +119,25 @@ def _save_assignment(obj):
 
 
 def _load_config_from_db() -> str:
-    """Load the feature flagging configuration from the database."""
+    """Load the feature flagging configuration from the database.
+
+    This is polled on every reload, but the config rarely changes. So only the
+    active config's ID and update time are queried each time, and the blob is
+    only fetched again when those change.
+    """
     session = config.experiments.store.driver.sync_session
     logger.debug("Fetching latest alligater config from database")
 
     with session.begin() as tx:
         try:
-            gater = tx.query(Gater).where(Gater.active).one()
-            return gater.blob
+            version = tuple(tx.execute(_active_version_stmt).one())
+            blob = _config_cache.get(version)
+            if blob is None:
+                logger.debug("Active alligater config changed, fetching blob")
+                blob = tx.execute(_config_blob_stmt, {"id": version[0]}).scalar_one()
+                _config_cache.clear()
+                _config_cache[version] = blob
+            return blob
         except Exception as e:
             logger.error(f"Failed to fetch alligater config: {e}")
             return ""
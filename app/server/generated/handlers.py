@@ -67,13 +67,19 @@ class _VHandler:
     def __getattr__(self, item: str) -> Callable:
         """Dynamically load the handler for the given item.
 
+        This is only called the first time a handler is requested. The
+        handler is then set on the instance, so later lookups for it are
+        plain attribute access.
+
         Args:
             item (str): The name of the handler to get.
 
         Returns:
             Callable: The handler for the given item.
         """
-        return self._get_handler(item)
+        handler = self._get_handler(item)
+        setattr(self, item, handler)
+        return handler
 
     def _get_handler(self, name: str) -> Callable:
         """Get the handler by `name` from the loaded module.
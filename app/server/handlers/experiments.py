@@ -34,16 +34,19 @@ from ..generated.models import (
 )
 from ..generated.models import Exposure as ExposureModel
 
+_REVIEW_TYPES = {
+    ReviewProtocol.BLIND_REVIEW: ReviewType.blind,
+    ReviewProtocol.FINAL_REVIEW: ReviewType.final,
+}
+"""ReviewType for each ReviewProtocol."""
+
 
 def review_protocol_to_review_type(protocol: ReviewProtocol) -> ReviewType:
     """Convert a ReviewProtocol to a ReviewType."""
-    match protocol:
-        case ReviewProtocol.BLIND_REVIEW:
-            return ReviewType.blind
-        case ReviewProtocol.FINAL_REVIEW:
-            return ReviewType.final
-        case _:
-            raise ValueError(f"Unknown protocol: {protocol}")
+    try:
+        return _REVIEW_TYPES[protocol]
+    except KeyError:
+        raise ValueError(f"Unknown protocol: {protocol}") from None
 
 
 async def log_exposure(request: Request, body: ExposureModel) -> None:
@@ -54,17 +57,22 @@ async def log_exposure(request: Request, body: ExposureModel) -> None:
     subject_ids = (
         body.subjectId if isinstance(body.subjectId, list) else [body.subjectId]
     )
-    for subject_id in subject_ids:
-        exp = Exposure(
-            jurisdiction_id=body.jurisdictionId,
-            case_id=body.caseId,
-            subject_id=subject_id,
-            extra=body.extra,
-            document_ids=json.dumps(body.documentIds),
-            reviewer_id=body.reviewingAttorneyMaskedId,
-            review_type=review_protocol_to_review_type(body.protocol),
-        )
-        request.state.db.add(exp)
+    document_ids = json.dumps(body.documentIds)
+    review_type = review_protocol_to_review_type(body.protocol)
+    request.state.db.add_all(
+        [
+            Exposure(
+                jurisdiction_id=body.jurisdictionId,
+                case_id=body.caseId,
+                subject_id=subject_id,
+                extra=body.extra,
+                document_ids=document_ids,
+                reviewer_id=body.reviewingAttorneyMaskedId,
+                review_type=review_type,
+            )
+            for subject_id in subject_ids
+        ]
+    )
     return
 
 
@@ -85,25 +93,37 @@ async def log_outcome(request: Request, body: Review) -> None:
     subject_ids = (
         body.subjectId if isinstance(body.subjectId, list) else [body.subjectId]
     )
-    for subject_id in subject_ids:
-        outcome = Outcome(
-            jurisdiction_id=body.jurisdictionId,
-            case_id=body.caseId,
-            subject_id=subject_id,
-            reviewer_id=body.reviewingAttorneyMaskedId,
-            document_ids=json.dumps(body.documentIds),
-            page_open_ts=body.timestamps.pageOpen,
-            decision_ts=body.timestamps.decision,
-            disqualifiers=[OutcomeDisqualifiers(disqualifier=d) for d in disqualifiers],
-            **decision_params_dict,
-        )
-
-        request.state.db.add(outcome)
+    document_ids = json.dumps(body.documentIds)
+    # NOTE: Each outcome needs its own disqualifier rows, so those are built
+    # per subject.
+    request.state.db.add_all(
+        [
+            Outcome(
+                jurisdiction_id=body.jurisdictionId,
+                case_id=body.caseId,
+                subject_id=subject_id,
+                reviewer_id=body.reviewingAttorneyMaskedId,
+                document_ids=document_ids,
+                page_open_ts=body.timestamps.pageOpen,
+                decision_ts=body.timestamps.decision,
+                disqualifiers=[
+                    OutcomeDisqualifiers(disqualifier=d) for d in disqualifiers
+                ],
+                **decision_params_dict,
+            )
+            for subject_id in subject_ids
+        ]
+    )
     return
 
 
 class OutcomeDecision(BaseModel):
-    """Subset of Outcome model fields that are relevant to the decision."""
+    """Subset of Outcome model fields that are relevant to the decision.
+
+    NOTE: This is only built from request bodies that FastAPI has already
+    validated, via the conversions below. So it's created with `model_construct`
+    to skip validating the same values a second time.
+    """
 
     review_type: ReviewType
     decision: Decision
@@ -129,50 +149,56 @@ def infer_review_type_from_decision(decision: ReviewDecision) -> ReviewType:
         raise ValueError(f"Unknown decision type: {type(decision)}")
 
 
+_FINAL_DECISIONS = {
+    FinalChargingDecision.CHARGE: Decision.charge,
+    FinalChargingDecision.DECLINE: Decision.decline,
+}
+"""Decision for each FinalChargingDecision."""
+
+
 def final_decision_to_decision(final_decision: FinalChargingDecision) -> Decision:
     """Convert a FinalChargingDecision to a Decision."""
-    match final_decision:
-        case FinalChargingDecision.CHARGE:
-            return Decision.charge
-        case FinalChargingDecision.DECLINE:
-            return Decision.decline
-        case _:
-            raise ValueError(f"Unknown final decision: {final_decision}")
+    try:
+        return _FINAL_DECISIONS[final_decision]
+    except KeyError:
+        raise ValueError(f"Unknown final decision: {final_decision}") from None
+
+
+_BLIND_DECISIONS = {
+    BlindChargingDecision.CHARGE_LIKELY: Decision.charge_likely,
+    BlindChargingDecision.CHARGE_MAYBE: Decision.charge_maybe,
+    BlindChargingDecision.DECLINE_MAYBE: Decision.decline_maybe,
+    BlindChargingDecision.DECLINE_LIKELY: Decision.decline_likely,
+}
+"""Decision for each BlindChargingDecision."""
 
 
 def blind_decision_to_decision(blind_decision: BlindChargingDecision) -> Decision:
     """Convert a BlindChargingDecision to a Decision."""
-    match blind_decision:
-        case BlindChargingDecision.CHARGE_LIKELY:
-            return Decision.charge_likely
-        case BlindChargingDecision.CHARGE_MAYBE:
-            return Decision.charge_maybe
-        case BlindChargingDecision.DECLINE_MAYBE:
-            return Decision.decline_likely
-        case BlindChargingDecision.DECLINE_LIKELY:
-            return Decision.decline_likely
-        case _:
-            raise ValueError(f"Unknown blind decision: {blind_decision}")
+    try:
+        return _BLIND_DECISIONS[blind_decision]
+    except KeyError:
+        raise ValueError(f"Unknown blind decision: {blind_decision}") from None
+
+
+_DISQUALIFIERS = {
+    DisqualifyingReason.ASSIGNED_TO_UNBLIND: Disqualifier.assigned_to_unblind,
+    DisqualifyingReason.CASE_TYPE_INELIGIBLE: Disqualifier.case_type_ineligible,
+    DisqualifyingReason.PRIOR_KNOWLEDGE_BIAS: Disqualifier.prior_knowledge_bias,
+    DisqualifyingReason.NARRATIVE_INCOMPLETE: Disqualifier.narrative_incomplete,
+    DisqualifyingReason.REDACTION_MISSING: Disqualifier.redaction_missing,
+    DisqualifyingReason.REDACTION_ILLEGIBLE: Disqualifier.redaction_illegible,
+    DisqualifyingReason.OTHER: Disqualifier.other,
+}
+"""Disqualifier for each DisqualifyingReason."""
 
 
 def disqualifying_reason_to_disqualifier(reason: DisqualifyingReason) -> Disqualifier:
-    match reason:
-        case DisqualifyingReason.ASSIGNED_TO_UNBLIND:
-            return Disqualifier.assigned_to_unblind
-        case DisqualifyingReason.CASE_TYPE_INELIGIBLE:
-            return Disqualifier.case_type_ineligible
-        case DisqualifyingReason.PRIOR_KNOWLEDGE_BIAS:
-            return Disqualifier.prior_knowledge_bias
-        case DisqualifyingReason.NARRATIVE_INCOMPLETE:
-            return Disqualifier.narrative_incomplete
-        case DisqualifyingReason.REDACTION_MISSING:
-            return Disqualifier.redaction_missing
-        case DisqualifyingReason.REDACTION_ILLEGIBLE:
-            return Disqualifier.redaction_illegible
-        case DisqualifyingReason.OTHER:
-            return Disqualifier.other
-        case _:
-            raise ValueError(f"Unknown disqualifying reason: {reason}")
+    """Convert a DisqualifyingReason to a Disqualifier."""
+    try:
+        return _DISQUALIFIERS[reason]
+    except KeyError:
+        raise ValueError(f"Unknown disqualifying reason: {reason}") from None
 
 
 def disqualifying_reason_to_disqualifiers(
@@ -188,14 +214,14 @@ def format_blind_review_outcome(
 ) -> OutcomeDecision:
     """Format a BlindReviewDecision outcome into an OutcomeDecision."""
     if isinstance(outcome, BlindDecisionOutcome):
-        return OutcomeDecision(
+        return OutcomeDecision.model_construct(
             review_type=ReviewType.blind,
             decision=blind_decision_to_decision(outcome.blindChargingDecision),
             explanation=outcome.blindChargingDecisionExplanation,
             additional_evidence=outcome.additionalEvidence,
         )
     elif isinstance(outcome, DisqualifyOutcome):
-        decision = OutcomeDecision(
+        decision = OutcomeDecision.model_construct(
             review_type=ReviewType.blind,
             decision=Decision.disqualify,
             explanation=outcome.disqualifyingReasonExplanation,
@@ -220,7 +246,7 @@ def format_review_decision(decision: ReviewDecision) -> OutcomeDecision:
     if isinstance(decision.root, BlindReviewDecision):
         return format_blind_review_outcome(decision.root.outcome)
     elif isinstance(decision.root, FinalReviewDecision):
-        return OutcomeDecision(
+        return OutcomeDecision.model_construct(
             review_type=ReviewType.final,
             decision=final_decision_to_decision(
                 decision.root.outcome.finalChargingDecision
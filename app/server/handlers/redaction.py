@@ -274,7 +274,12 @@ async def _get_doc_result(
                 )
             )
         case "RETRY":
-            retry_state = await get_retry_state(state_info.result.id)
+            retry_state = await get_retry_state(store.store, state_info.result.id)
+            retry_detail = (
+                ", ".join(f"{k}={v}" for k, v in retry_state.items())
+                if retry_state
+                else "unknown"
+            )
             return RedactionResult(
                 RedactionResultPending(
                     jurisdictionId=jurisdiction_id,
@@ -285,7 +290,7 @@ async def _get_doc_result(
                     statusDetail=(
                         "One step of the redaction job has failed "
                         "and is currently being retried. Detail: "
-                        f"{retry_state}"
+                        f"{retry_detail}"
                     ),
                 )
             )
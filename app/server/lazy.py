@@ -16,6 +16,9 @@ class LazyObjectProxy:
         if self._obj is None:
             f, args, kwargs = self._loader
             self._obj = f(*args, **kwargs)
+            # NOTE: Once loaded, swap to a class that skips the load check
+            # so that subsequent lookups forward directly to the object.
+            self.__class__ = _LoadedObjectProxy
         return getattr(self._obj, name)
 
     def _reset(self, *args, **kwargs):
@@ -28,6 +31,14 @@ class LazyObjectProxy:
             *args: Positional arguments to pass to the loader.
             **kwargs: Keyword arguments to pass to the loader.
         """
+        self.__class__ = LazyObjectProxy
         del self._obj
         self._obj = None
         self._loader = (self._loader[0], args, kwargs)
+
+
+class _LoadedObjectProxy(LazyObjectProxy):
+    """A LazyObjectProxy whose object has already been loaded."""
+
+    def __getattr__(self, name):
+        return getattr(self._obj, name)
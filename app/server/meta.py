@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import platform
@@ -194,6 +195,9 @@ def _get_root_dir() -> str:
     return os.path.abspath(os.path.join(this_dir, "..", ".."))
 
 
+# NOTE: The versions are read from files that don't change while the server is
+# running, so they're only parsed once rather than on every status request.
+@functools.cache
 def _get_api_version() -> str:
     pyproject_toml = os.path.join(_get_root_dir(), "pyproject.toml")
     with open(pyproject_toml, "r") as f:
@@ -202,6 +206,7 @@ def _get_api_version() -> str:
         return project["project"]["version"]
 
 
+@functools.cache
 def _get_schema_version() -> str:
     openai_yaml = os.path.join(_get_root_dir(), "app", "schema", "openapi.yaml")
     with open(openai_yaml, "r") as f:
@@ -1,5 +1,5 @@
 import logging
-from typing import TYPE_CHECKING, Awaitable, Literal, TypeVar, cast
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Literal, TypeVar, cast
 
 import redis.asyncio as aioredis
 from pydantic import BaseModel
@@ -139,13 +139,28 @@ class RedisClusterStoreSession(StoreSession):
         result = await self.cluster.get(k)  # type: ignore[attr-defined]
         return result
 
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        ks = [self._key_func(key) for key in keys]
+        return await self.cluster.mget_nonatomic(ks)  # type: ignore[attr-defined]
+
     async def hgetall(self, key: str) -> dict[bytes, bytes]:
         k = self._key_func(key)
         return await _maybe_wait(self.cluster.hgetall(k))  # type: ignore[attr-defined]
 
-    async def enqueue(self, key: str, value: str):
+    async def hmget(self, key: str, fields: list[str]) -> list[bytes | None]:
+        k = self._key_func(key)
+        return await _maybe_wait(self.cluster.hmget(k, fields))  # type: ignore[attr-defined]
+
+    async def hscan_iter(
+        self, key: str, count: int | None = None
+    ) -> AsyncIterator[tuple[bytes, bytes]]:
         k = self._key_func(key)
-        self.pipe.lpush(k, value)  # type: ignore[attr-defined]
+        async for field, value in self.cluster.hscan_iter(k, count=count):  # type: ignore[attr-defined]
+            yield field, value
+
+    async def enqueue(self, key: str, *value: str):
+        k = self._key_func(key)
+        self.pipe.lpush(k, *value)  # type: ignore[attr-defined]
 
     async def dequeue(self, key: str) -> bytes | None:
         k = self._key_func(key)
@@ -165,6 +180,11 @@ class RedisClusterStoreSession(StoreSession):
         logger.debug("Redis cluster expireat %r -> %r", k, expire_at)
         self.pipe.expireat(k, expire_at)  # type: ignore[attr-defined]
 
+    async def expire(self, key: str, ttl: int):
+        k = self._key_func(key)
+        logger.debug("Redis cluster expire %r -> %r", k, ttl)
+        self.pipe.expire(k, ttl)  # type: ignore[attr-defined]
+
     async def hsetmapping(self, key: str, mapping: SimpleMapping):
         k = self._key_func(key)
         self.pipe.hset(k, mapping=dict(mapping))  # type: ignore[attr-defined]
@@ -204,9 +224,21 @@ class BaseSimpleRedisStoreSession(StoreSession):
         # await self.pipe.watch(key)
         return await self.client.get(key)
 
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        return await self.client.mget(keys)
+
     async def hgetall(self, key: str) -> dict[bytes, bytes]:
         return await _maybe_wait(self.client.hgetall(key))
 
+    async def hmget(self, key: str, fields: list[str]) -> list[bytes | None]:
+        return await _maybe_wait(self.client.hmget(key, fields))
+
+    async def hscan_iter(
+        self, key: str, count: int | None = None
+    ) -> AsyncIterator[tuple[bytes, bytes]]:
+        async for field, value in self.client.hscan_iter(key, count=count):
+            yield field, value
+
     async def dequeue(self, key: str) -> bytes | None:
         # NOTE: using a cast here because the typing is misleading in the library.
         # The library gives `str | list | None`. This should really be written using
@@ -226,8 +258,11 @@ class BaseSimpleRedisStoreSession(StoreSession):
     async def expire_at(self, key: str, expire_at: int):
         await self.pipe.expireat(key, expire_at)
 
-    async def enqueue(self, key: str, value: str):
-        await _maybe_wait(self.pipe.lpush(key, value))
+    async def expire(self, key: str, ttl: int):
+        await self.pipe.expire(key, ttl)
+
+    async def enqueue(self, key: str, *value: str):
+        await _maybe_wait(self.pipe.lpush(key, *value))
 
     async def sadd(self, key: str, *value):
         await _maybe_wait(self.pipe.sadd(key, *value))
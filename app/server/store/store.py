@@ -1,6 +1,6 @@
 import json
 from abc import ABC, abstractmethod
-from typing import Mapping, Type, TypeVar, Union
+from typing import AsyncIterator, Mapping, Sequence, Type, TypeVar, Union
 
 from pydantic import BaseModel
 
@@ -45,6 +45,9 @@ class StoreSession(ABC):
     @abstractmethod
     async def get(self, key: str) -> bytes | None: ...
 
+    @abstractmethod
+    async def mget(self, keys: list[str]) -> list[bytes | None]: ...
+
     async def getdict(self, key: str) -> dict[str, SimpleType] | None:
         """Get a dictionary of values.
 
@@ -69,10 +72,30 @@ class StoreSession(ABC):
         Returns:
             T | None: The dequeued value.
         """
-        value = await self.getdict(key)
+        value = await self.get(key)
         if value is None:
             return None
-        return cls.model_validate(value)
+        return cls.model_validate_json(value)
+
+    async def mget_models(
+        self, cls: Type[SomeModel], keys: list[str]
+    ) -> list[SomeModel | None]:
+        """Get several Pydantic models in one round-trip.
+
+        Args:
+            cls (Type[T]): The Pydantic model class.
+            keys (list[str]): The keys to fetch.
+
+        Returns:
+            list[T | None]: The values, in the same order as `keys`.
+        """
+        if not keys:
+            return []
+        values = await self.mget(keys)
+        return [
+            cls.model_validate_json(value) if value is not None else None
+            for value in values
+        ]
 
     @abstractmethod
     async def sadd(self, key: str, *value: SimpleType): ...
@@ -114,7 +137,8 @@ class StoreSession(ABC):
             key (str): The key of the set.
             value (BaseModel): The value to set.
         """
-        await self.setdict(key, value.model_dump(mode="json"))
+        # NOTE: Pydantic serializes straight to JSON, without building a dict.
+        await self.set(key, value.model_dump_json())
 
     @abstractmethod
     async def hsetmapping(self, key: str, mapping: SimpleMapping): ...
@@ -122,11 +146,43 @@ class StoreSession(ABC):
     @abstractmethod
     async def hgetall(self, key: str) -> dict[bytes, bytes]: ...
 
+    @abstractmethod
+    async def hmget(self, key: str, fields: list[str]) -> list[bytes | None]: ...
+
+    async def hgetall_str(self, key: str) -> dict[str, str]:
+        """Get all the fields of a hash, decoded as UTF-8 strings.
+
+        Args:
+            key (str): The key of the hash.
+
+        Returns:
+            dict[str, str]: The decoded hash.
+        """
+        result = await self.hgetall(key)
+        # Decode with `map` so the per-entry work stays in C.
+        return dict(
+            zip(
+                map(bytes.decode, result.keys()),
+                map(bytes.decode, result.values()),
+                strict=True,
+            )
+        )
+
+    # NOTE: Declared without `async` because implementations are async
+    # generators; mypy types an abstract `async def` as returning a coroutine.
+    @abstractmethod
+    def hscan_iter(
+        self, key: str, count: int | None = None
+    ) -> AsyncIterator[tuple[bytes, bytes]]: ...
+
     @abstractmethod
     async def expire_at(self, key: str, expire_at: int): ...
 
     @abstractmethod
-    async def enqueue(self, key: str, value: str): ...
+    async def expire(self, key: str, ttl: int): ...
+
+    @abstractmethod
+    async def enqueue(self, key: str, *value: str): ...
 
     @abstractmethod
     async def dequeue(self, key: str) -> bytes | None: ...
@@ -149,6 +205,23 @@ class StoreSession(ABC):
         """
         await self.enqueue(key, json.dumps(value, sort_keys=True))
 
+    async def enqueue_models(self, key: str, values: Sequence[BaseModel]):
+        """Enqueue several Pydantic models with a single command.
+
+        The models are enqueued in order, as if `enqueue_model` had been
+        called on each one.
+
+        Args:
+            key (str): The key of the queue.
+            values (Sequence[BaseModel]): The values to enqueue.
+        """
+        if not values:
+            return
+        await self.enqueue(
+            key,
+            *(json.dumps(v.model_dump(mode="json"), sort_keys=True) for v in values),
+        )
+
     async def dequeue_dict(self, key: str) -> dict[str, SimpleType] | None:
         """Dequeue a dictionary.
 
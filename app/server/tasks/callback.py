@@ -1,4 +1,3 @@
-import asyncio
 import json
 import logging
 
@@ -9,7 +8,7 @@ from pydantic import BaseModel
 from app.func import allf
 
 from ..case import CaseStore
-from ..case_helper import save_retry_state_sync
+from ..case_helper import run_with_store_sync, save_retry_state_sync
 from ..config import config
 from ..generated.models import (
     MaskedSubject,
@@ -18,6 +17,7 @@ from ..generated.models import (
     RedactionResultError,
     RedactionResultSuccess,
 )
+from ..store import StoreSession
 from .format import FormatTaskResult
 from .metrics import (
     celery_counters,
@@ -166,14 +166,12 @@ def get_masks_sync(jurisdiction_id: str, case_id: str) -> list[MaskedSubject]:
         list[MaskedSubject]: The masked subjects.
     """
 
-    async def _get_masks_with_store() -> list[MaskedSubject]:
-        async with config.queue.store.driver() as store:
-            async with store.tx() as tx:
-                cs = CaseStore(tx)
-                await cs.init(jurisdiction_id, case_id)
-                return await cs.get_masked_names()
+    async def _get_masks_with_store(tx: StoreSession) -> list[MaskedSubject]:
+        cs = CaseStore(tx)
+        await cs.init(jurisdiction_id, case_id)
+        return await cs.get_masked_names()
 
-    return asyncio.run(_get_masks_with_store())
+    return run_with_store_sync(_get_masks_with_store)
 
 
 def get_result_sync(
@@ -190,11 +188,9 @@ def get_result_sync(
         OutputDocument | None: The redacted document.
     """
 
-    async def _get_result_with_store() -> OutputDocument | None:
-        async with config.queue.store.driver() as store:
-            async with store.tx() as tx:
-                cs = CaseStore(tx)
-                await cs.init(jurisdiction_id, case_id)
-                return await cs.get_result_doc(doc_id)
+    async def _get_result_with_store(tx: StoreSession) -> OutputDocument | None:
+        cs = CaseStore(tx)
+        await cs.init(jurisdiction_id, case_id)
+        return await cs.get_result_doc(doc_id)
 
-    return asyncio.run(_get_result_with_store())
+    return run_with_store_sync(_get_result_with_store)
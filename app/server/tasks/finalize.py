@@ -1,4 +1,3 @@
-import asyncio
 import json
 import logging
 
@@ -9,10 +8,15 @@ from pydantic import BaseModel
 from app.func import allf
 
 from ..case import CaseStore
-from ..case_helper import save_retry_state_sync, summarize_state
+from ..case_helper import (
+    run_with_store_sync,
+    save_retry_state_sync,
+    summarize_state,
+)
 from ..config import config
 from ..db import DocumentStatus
 from ..generated.models import OutputFormat, RedactionTarget
+from ..store import StoreSession
 from .callback import CallbackTaskResult
 from .metrics import (
     celery_counters,
@@ -138,44 +142,42 @@ def get_next_object_sync(jurisdiction_id: str, case_id: str) -> RedactionTarget
         RedactionTarget: The next object to redact, or None.
     """
 
-    async def _get_objects() -> RedactionTarget | None:
+    async def _get_objects(tx: StoreSession) -> RedactionTarget | None:
         logging.debug(f"Getting next object for {jurisdiction_id}:{case_id} ...")
-        async with config.queue.store.driver() as store:
-            async with store.tx() as tx:
-                cs = CaseStore(tx)
-                await cs.init(jurisdiction_id, case_id)
-                doc_tasks = await cs.get_doc_tasks()
-                logging.debug(f"Found {len(doc_tasks)} existing task(s).")
-
-                while True:
-                    next_object = await cs.pop_object()
-                    if not next_object:
-                        logging.debug("No more objects to check, all done processing.")
-                        return None
-                    # Validate that the next object needs to be redacted.
-                    existing_tasks = doc_tasks.get(next_object.document.root.documentId)
-                    if not existing_tasks:
-                        logging.debug(
-                            f"Found next object for {jurisdiction_id}:{case_id}: "
-                            f"{next_object.document.root.documentId}"
-                        )
-                        return next_object
-
-                    summary = summarize_state([get_result(t) for t in existing_tasks])
-                    if summary.simple_state == "FAILURE":
-                        logging.debug(
-                            f"Found failed task for {jurisdiction_id}:{case_id}: "
-                            f"{next_object.document.root.documentId}. Retrying."
-                        )
-                        return next_object
-                    else:
-                        logging.debug(
-                            f"Found existing tasks for {jurisdiction_id}:{case_id}: "
-                            f"{next_object.document.root.documentId} "
-                            f"({summary.simple_state}). Skipping."
-                        )
-
-    return asyncio.run(_get_objects())
+        cs = CaseStore(tx)
+        await cs.init(jurisdiction_id, case_id)
+        doc_tasks = await cs.get_doc_tasks()
+        logging.debug(f"Found {len(doc_tasks)} existing task(s).")
+
+        while True:
+            next_object = await cs.pop_object()
+            if not next_object:
+                logging.debug("No more objects to check, all done processing.")
+                return None
+            # Validate that the next object needs to be redacted.
+            existing_tasks = doc_tasks.get(next_object.document.root.documentId)
+            if not existing_tasks:
+                logging.debug(
+                    f"Found next object for {jurisdiction_id}:{case_id}: "
+                    f"{next_object.document.root.documentId}"
+                )
+                return next_object
+
+            summary = summarize_state([get_result(t) for t in existing_tasks])
+            if summary.simple_state == "FAILURE":
+                logging.debug(
+                    f"Found failed task for {jurisdiction_id}:{case_id}: "
+                    f"{next_object.document.root.documentId}. Retrying."
+                )
+                return next_object
+            else:
+                logging.debug(
+                    f"Found existing tasks for {jurisdiction_id}:{case_id}: "
+                    f"{next_object.document.root.documentId} "
+                    f"({summary.simple_state}). Skipping."
+                )
+
+    return run_with_store_sync(_get_objects)
 
 
 def save_doc_task_sync(
@@ -190,11 +192,9 @@ def save_doc_task_sync(
         task (AsyncResult): The task.
     """
 
-    async def _save_id() -> None:
-        async with config.queue.store.driver() as store:
-            async with store.tx() as tx:
-                cs = CaseStore(tx)
-                await cs.init(jurisdiction_id, case_id)
-                return await cs.save_doc_task(doc_id, task)
+    async def _save_id(tx: StoreSession) -> None:
+        cs = CaseStore(tx)
+        await cs.init(jurisdiction_id, case_id)
+        return await cs.save_doc_task(doc_id, task)
 
-    return asyncio.run(_save_id())
+    return run_with_store_sync(_save_id)
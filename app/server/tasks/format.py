@@ -1,4 +1,3 @@
-import asyncio
 import base64
 import json
 
@@ -10,8 +9,11 @@ from pydantic import AnyUrl, BaseModel
 from app.func import allf
 
 from ..case import CaseStore
-from ..case_helper import get_document_sync, save_retry_state_sync
-from ..config import config
+from ..case_helper import (
+    get_document_sync,
+    run_with_store_sync,
+    save_retry_state_sync,
+)
 from ..generated.models import (
     Content,
     DocumentContent,
@@ -20,6 +22,7 @@ from ..generated.models import (
     OutputDocument,
     OutputFormat,
 )
+from ..store import StoreSession
 from .metrics import (
     record_task_failure,
     record_task_retry,
@@ -202,11 +205,9 @@ def save_result_sync(
         ID in the store where the content was saved.
     """
 
-    async def _save():
-        async with config.queue.store.driver() as store:
-            async with store.tx() as tx:
-                cs = CaseStore(tx)
-                await cs.init(jurisdiction_id, case_id)
-                return await cs.save_result_doc(doc_id, document)
+    async def _save(tx: StoreSession):
+        cs = CaseStore(tx)
+        await cs.init(jurisdiction_id, case_id)
+        return await cs.save_result_doc(doc_id, document)
 
-    return asyncio.run(_save())
+    return run_with_store_sync(_save)
@@ -40,6 +40,14 @@ def setup_tracing(*args, **kwargs):
         logger.info("Celery tracing initialized.")
 
 
+@worker_process_init.connect(weak=False)
+def setup_store_loop(*args, **kwargs):
+    """Start the store event loop for the worker process."""
+    from ..case_helper import start_store_loop
+
+    start_store_loop()
+
+
 def get_result(task_id: str) -> AsyncResult:
     """Get the async result for a task."""
     return AsyncResult(task_id, app=queue)
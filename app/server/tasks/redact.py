@@ -1,4 +1,3 @@
-import asyncio
 import io
 
 from bc2 import Pipeline, PipelineConfig
@@ -22,10 +21,16 @@ from pydantic import BaseModel
 from app.func import allf
 
 from ..case import CaseStore, MaskInfo
-from ..case_helper import get_document_sync, save_document_sync, save_retry_state_sync
+from ..case_helper import (
+    get_document_sync,
+    run_with_store_sync,
+    save_document_sync,
+    save_retry_state_sync,
+)
 from ..config import config
 from ..db import DocumentEmbedding, RdbmsConfig
 from ..generated.models import OutputFormat
+from ..store import StoreSession
 from .fetch import FetchTaskResult
 from .metrics import (
     record_task_failure,
@@ -283,14 +288,12 @@ def get_mask_info_sync(jurisdiction_id: str, case_id: str) -> MaskInfo:
         MaskInfo: Data about masks for the case.
     """
 
-    async def _fetch():
-        async with config.queue.store.driver() as store:
-            async with store.tx() as tx:
-                cs = CaseStore(tx)
-                await cs.init(jurisdiction_id, case_id)
-                return await cs.get_mask_info()
+    async def _fetch(tx: StoreSession) -> MaskInfo:
+        cs = CaseStore(tx)
+        await cs.init(jurisdiction_id, case_id)
+        return await cs.get_mask_info()
 
-    return asyncio.run(_fetch())
+    return run_with_store_sync(_fetch)
 
 
 def save_inferred_case_data_sync(jurisdiction_id: str, case_id: str, context: Context):
@@ -302,24 +305,22 @@ def save_inferred_case_data_sync(jurisdiction_id: str, case_id: str, context: Co
         context (Context): The context from the pipeline run.
     """
 
-    async def _save():
-        async with config.queue.store.driver() as store:
-            async with store.tx() as tx:
-                cs = CaseStore(tx)
-                await cs.init(jurisdiction_id, case_id)
+    async def _save(tx: StoreSession) -> None:
+        cs = CaseStore(tx)
+        await cs.init(jurisdiction_id, case_id)
 
-                if context.masked_subjects:
-                    await cs.save_masked_names(context.masked_subjects)
-                else:
-                    logger.warning("No masked subjects found in context")
+        if context.masked_subjects:
+            await cs.save_masked_names(context.masked_subjects)
+        else:
+            logger.warning("No masked subjects found in context")
 
-                if context.placeholders:
-                    await cs.save_placeholders(context.placeholders)
-                else:
-                    logger.warning("No placeholders found in context")
+        if context.placeholders:
+            await cs.save_placeholders(context.placeholders)
+        else:
+            logger.warning("No placeholders found in context")
 
     if not context:
         logger.warning("No context available to save")
         return
 
-    return asyncio.run(_save())
+    return run_with_store_sync(_save)
@@ -1,10 +1,26 @@
+import inspect
+from types import SimpleNamespace
+from typing import cast
+
 import pytest
 from bc2.core.common.name_map import IdToNameMap, NameToMaskMap
 from fakeredis import FakeRedis
 
-from app.server.case import CaseStore
+from app.server.case import (
+    _HSCAN_BATCH_SIZE,
+    _OFFLOAD_THRESHOLD_BYTES,
+    CaseStore,
+    MaskInfo,
+    SavedMask,
+    _is_large_doc,
+)
 from app.server.config import Config
-from app.server.generated.models import HumanName
+from app.server.generated.models import (
+    DocumentText,
+    HumanName,
+    MaskedSubject,
+    OutputDocument,
+)
 
 
 @pytest.mark.parametrize(
@@ -161,3 +177,146 @@ async def test_get_name_mask_map(fake_redis_store: FakeRedis, config: Config, sp
             mask_info = await cs.get_mask_info()
             assert mask_info.get_name_mask_map() == spec["expected_name_mask_map"]
             assert mask_info.get_id_name_map() == spec["expected_id_name_map"]
+
+
+async def test_get_masked_names_for_subjects(
+    fake_redis_store: FakeRedis, config: Config
+):
+    fake_redis_store.hset("jur1:case1:mask", "sub1", "Accused 1")
+    fake_redis_store.hset("jur1:case1:mask", "sub2", "Victim 1")
+
+    async with config.queue.store.driver() as store:
+        async with store.tx() as tx:
+            cs = CaseStore(tx)
+            await cs.init("jur1", "case1")
+            assert await cs.get_masked_names(["sub2", "sub3"]) == [
+                MaskedSubject(subjectId="sub2", alias="Victim 1"),
+            ]
+            assert sorted(await cs.get_masked_names(), key=lambda m: m.subjectId) == [
+                MaskedSubject(subjectId="sub1", alias="Accused 1"),
+                MaskedSubject(subjectId="sub2", alias="Victim 1"),
+            ]
+
+
+async def test_ensure_init_async(fake_redis_store: FakeRedis, config: Config):
+    async with config.queue.store.driver() as store:
+        async with store.tx() as tx:
+            cs = CaseStore(tx)
+            assert inspect.iscoroutinefunction(CaseStore.get_doc_tasks)
+            assert CaseStore.get_doc_tasks.__name__ == "get_doc_tasks"
+            with pytest.raises(ValueError, match="not initialized"):
+                await cs.get_doc_tasks()
+            with pytest.raises(ValueError, match="not initialized"):
+                cs.key("task")
+
+
+async def test_case_writes_expire(fake_redis_store: FakeRedis, config: Config):
+    doc = OutputDocument(
+        root=DocumentText(documentId="doc1", attachmentType="TEXT", content="hi")
+    )
+    async with config.queue.store.driver() as store:
+        async with store.tx() as tx:
+            cs = CaseStore(tx)
+            await cs.init("jur1", "case1", ttl=100)
+            await cs.save_result_doc("doc1", doc)
+            await cs.save_real_name(
+                "sub1", HumanName(firstName="jack", lastName="doe"), primary=True
+            )
+
+    for k in [
+        "jur1:case1:expires",
+        "jur1:case1:result:doc1",
+        "jur1:case1:aliases:sub1",
+        "jur1:case1:aliases:sub1:primary",
+    ]:
+        assert 0 < fake_redis_store.ttl(k) <= 100, k
+
+
+async def test_large_result_doc_roundtrip(fake_redis_store: FakeRedis, config: Config):
+    small = OutputDocument(
+        root=DocumentText(documentId="doc1", attachmentType="TEXT", content="hi")
+    )
+    large = OutputDocument(
+        root=DocumentText(
+            documentId="doc2",
+            attachmentType="TEXT",
+            content="x" * _OFFLOAD_THRESHOLD_BYTES,
+        )
+    )
+    assert not _is_large_doc(small)
+    assert _is_large_doc(large)
+
+    async with config.queue.store.driver() as store:
+        async with store.tx() as tx:
+            cs = CaseStore(tx)
+            await cs.init("jur1", "case1")
+            await cs.save_result_doc("doc1", small)
+            await cs.save_result_doc("doc2", large)
+
+        async with store.tx() as tx:
+            cs = CaseStore(tx)
+            await cs.init("jur1", "case1")
+            assert await cs.get_result_doc("doc1") == small
+            assert await cs.get_result_doc("doc2") == large
+
+
+async def test_get_doc_tasks_many(fake_redis_store: FakeRedis, config: Config):
+    n = 2 * _HSCAN_BATCH_SIZE + 1
+    fake_redis_store.hset(
+        "jur1:case1:task",
+        mapping={f"doc{i}": f"t{i}a,t{i}b" for i in range(n)},
+    )
+
+    async with config.queue.store.driver() as store:
+        async with store.tx() as tx:
+            cs = CaseStore(tx)
+            await cs.init("jur1", "case1")
+            tasks = await cs.get_doc_tasks()
+
+    assert tasks == {f"doc{i}": [f"t{i}a", f"t{i}b"] for i in range(n)}
+
+
+def test_mask_info_set_invalidates_maps():
+    mask_info = MaskInfo(
+        {b"sub1": SavedMask(role="accused", mask="Accused 1", name="jack doe")},
+        extra_placeholders={"jd": "Accused 1"},
+    )
+    assert mask_info.get_name_mask_map() == NameToMaskMap(
+        {"jack doe": "Accused 1", "jd": "Accused 1"}
+    )
+    assert mask_info.get_id_name_map() == IdToNameMap({"sub1": "jack doe"})
+
+    mask_info.set(b"sub2", SavedMask(role="victim", mask="Victim 1", name="jane doe"))
+    assert mask_info.get_name_mask_map() == NameToMaskMap(
+        {"jack doe": "Accused 1", "jane doe": "Victim 1", "jd": "Accused 1"}
+    )
+    assert mask_info.get_id_name_map() == IdToNameMap(
+        {"sub1": "jack doe", "sub2": "jane doe"}
+    )
+
+
+async def test_save_doc_tasks(fake_redis_store: FakeRedis, config: Config):
+    def chain(*ids: str) -> SimpleNamespace:
+        node = None
+        for task_id in ids:
+            node = SimpleNamespace(id=task_id, parent=node)
+        return cast(SimpleNamespace, node)
+
+    async with config.queue.store.driver() as store:
+        async with store.tx() as tx:
+            cs = CaseStore(tx)
+            await cs.init("jur1", "case1")
+            await cs.save_doc_tasks(
+                {"doc1": chain("a", "b", "c"), "doc2": chain("d")}  # type: ignore[dict-item]
+            )
+            await cs.save_doc_task("doc3", chain("e", "f"))  # type: ignore[arg-type]
+
+        async with store.tx() as tx:
+            cs = CaseStore(tx)
+            await cs.init("jur1", "case1")
+            assert await cs.get_doc_tasks() == {
+                "doc1": ["a", "b", "c"],
+                "doc2": ["d"],
+                "doc3": ["e", "f"],
+            }
+    assert fake_redis_store.ttl("jur1:case1:task") > 0
@@ -0,0 +1,174 @@
+import asyncio
+import os
+import threading
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+from fakeredis import FakeRedis
+
+from app.server import case_helper
+from app.server.case_helper import (
+    _StoreLoop,
+    get_document_sync,
+    get_retry_state,
+    run_with_store_sync,
+    save_document_sync,
+    save_retry_state_sync,
+    summarize_state,
+)
+from app.server.config import Config
+
+
+def test_document_roundtrip(config: Config, fake_redis_store: FakeRedis):
+    key = save_document_sync(b"hello")
+    assert fake_redis_store.get(key) == b"hello"
+    assert fake_redis_store.ttl(key) > 0
+    assert get_document_sync(key) == b"hello"
+    assert get_document_sync("missing") == b""
+    assert get_document_sync(None) == b""
+
+
+class _FakeStore:
+    """Store driver that records its lifecycle."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.inits = 0
+        self.closed = False
+
+    async def init(self):
+        self.inits += 1
+
+    async def close(self):
+        self.closed = True
+
+    @asynccontextmanager
+    async def tx(self):
+        assert not self.closed, f"{self.name} used after close"
+        yield self
+
+
+class _FakeStoreConfig:
+    """Store config that hands out a new fake driver each time."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.drivers = list[_FakeStore]()
+
+    def driver(self) -> _FakeStore:
+        store = _FakeStore(f"{self.name}{len(self.drivers)}")
+        self.drivers.append(store)
+        return store
+
+
+@pytest.fixture
+def store_loop(config: Config, monkeypatch):
+    """Use a fresh store loop with fake store drivers."""
+    monkeypatch.setattr(case_helper, "_store_loop", _StoreLoop())
+    monkeypatch.setattr(config.queue, "store", _FakeStoreConfig("a"))
+    return config
+
+
+async def _store_name(tx) -> str:
+    return tx.name
+
+
+def test_store_loop_reuses_driver(store_loop: Config):
+    assert run_with_store_sync(_store_name) == "a0"
+    assert run_with_store_sync(_store_name) == "a0"
+    assert len(store_loop.queue.store.drivers) == 1
+    assert store_loop.queue.store.drivers[0].inits == 1
+
+
+def test_store_loop_swaps_idle_driver(store_loop: Config, monkeypatch):
+    old_config = store_loop.queue.store
+    assert run_with_store_sync(_store_name) == "a0"
+
+    monkeypatch.setattr(store_loop.queue, "store", _FakeStoreConfig("b"))
+    assert run_with_store_sync(_store_name) == "b0"
+    # Nobody was using the old driver, so it's closed right away.
+    assert old_config.drivers[0].closed
+    assert not store_loop.queue.store.drivers[0].closed
+
+
+def test_store_loop_defers_close_while_in_use(store_loop: Config, monkeypatch):
+    old_config = store_loop.queue.store
+    started = threading.Event()
+    release = threading.Event()
+    results = list[str]()
+
+    async def _slow(tx) -> None:
+        started.set()
+        await asyncio.get_running_loop().run_in_executor(None, release.wait)
+        results.append(tx.name)
+
+    worker = threading.Thread(target=run_with_store_sync, args=(_slow,))
+    worker.start()
+    assert started.wait(5)
+
+    # Reload the config while the old driver is still in use.
+    monkeypatch.setattr(store_loop.queue, "store", _FakeStoreConfig("b"))
+    assert run_with_store_sync(_store_name) == "b0"
+    old_store = old_config.drivers[0]
+    assert not old_store.closed
+
+    # The old driver is closed once its last user releases it.
+    release.set()
+    worker.join(5)
+    assert results == ["a0"]
+    assert old_store.closed
+    assert not store_loop.queue.store.drivers[0].closed
+
+
+def test_store_loop_restarts_after_fork(store_loop: Config, monkeypatch):
+    async def _loop_id(tx) -> int:
+        return id(asyncio.get_running_loop())
+
+    parent_loop = run_with_store_sync(_loop_id)
+    assert run_with_store_sync(_loop_id) == parent_loop
+
+    # Pretend we're now in a forked child process.
+    child_pid = os.getpid() + 1
+    monkeypatch.setattr(case_helper.os, "getpid", lambda: child_pid)
+    assert run_with_store_sync(_loop_id) != parent_loop
+    # The child gets its own driver; the parent's is left for the parent.
+    drivers = store_loop.queue.store.drivers
+    assert len(drivers) == 2
+    assert not drivers[0].closed
+
+
+def test_summarize_state():
+    results = [
+        SimpleNamespace(state="SUCCESS", name="a"),
+        SimpleNamespace(state="RETRY", name="b"),
+        SimpleNamespace(state="CUSTOM", name="c"),
+        SimpleNamespace(state="RETRY", name="d"),
+    ]
+    summary = summarize_state(results)
+    assert summary.simple_state == "RETRY"
+    assert summary.dominant_task_name == "b"
+    assert summary.result is results[1]
+
+    empty = summarize_state([])
+    assert empty.simple_state == "UNKNOWN"
+    assert empty.dominant_task_name == "<unknown>"
+    assert empty.result is None
+
+
+async def test_retry_state_roundtrip(config: Config, fake_redis_store: FakeRedis):
+    task = SimpleNamespace(
+        name="redact", request=SimpleNamespace(retries=1), max_retries=3
+    )
+    save_retry_state_sync(task, ValueError("boom"), "task1", [], {}, None)
+    assert fake_redis_store.ttl("task1:retry") > 0
+
+    async with config.queue.store.driver() as store:
+        async with store.tx() as tx:
+            state = await get_retry_state(tx, "task1")
+            assert state is not None
+            assert state["name"] == "redact"
+            assert state["exception"] == "boom"
+            assert state["attempts"] == "2"
+            assert state["max_attempts"] == "4"
+            assert await get_retry_state(tx, "missing") is None
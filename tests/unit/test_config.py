@@ -0,0 +1,32 @@
+import os
+from pathlib import Path
+
+from app.server.config import FileProcessorConfig, _load_config, _parse_config_file
+
+
+def test_file_processor_pipe_cached(tmp_path: Path):
+    pipe_file = tmp_path / "pipe.toml"
+    pipe_file.write_text('pipe = [{ engine = "redact:noop" }]')
+    processor = FileProcessorConfig(pipe_file=str(pipe_file))
+    assert processor.pipe == [{"engine": "redact:noop"}]
+
+    # The file is not read again until the processor is reloaded.
+    pipe_file.write_text('pipe = [{ engine = "extract:tesseract" }]')
+    assert processor.pipe == [{"engine": "redact:noop"}]
+
+    processor.reload()
+    assert processor.pipe == [{"engine": "extract:tesseract"}]
+
+
+def test_load_config_reparses_changed_file(tmp_path: Path):
+    config_file = tmp_path / "config.toml"
+    config_file.write_text("debug = true\n[processor]\npipe = []\n")
+    assert _load_config(str(config_file)).debug is True
+    # The cached parse is reused while the file is unchanged.
+    hits = _parse_config_file.cache_info().hits
+    assert _load_config(str(config_file)).debug is True
+    assert _parse_config_file.cache_info().hits == hits + 1
+
+    config_file.write_text("debug = false\n[processor]\npipe = []\n")
+    os.utime(config_file, ns=(0, 0))
+    assert _load_config(str(config_file)).debug is False
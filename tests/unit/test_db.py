@@ -0,0 +1,106 @@
+from datetime import datetime, timezone
+
+import pytest
+from glowplug import DbDriver
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+
+from app.server.db import (
+    Decision,
+    Disqualifier,
+    Gater,
+    Outcome,
+    OutcomeDisqualifiers,
+    ReviewType,
+    Revocation,
+    UUID7Type,
+    _get_by_id_stmt,
+    primary_key,
+    warm_up_pool,
+)
+
+
+def test_primary_key_time_ordered():
+    keys = [primary_key() for _ in range(1_000)]
+    assert len({k.bytes for k in keys}) == len(keys)
+    # The leading 48 bits are the creation time, so byte order follows creation
+    # order and inserts append to the end of the index.
+    prefixes = [k.bytes[:6] for k in keys]
+    assert prefixes == sorted(prefixes)
+
+
+def test_uuid7_type_roundtrip():
+    t = UUID7Type()
+    key = primary_key()
+    stored = t.process_bind_param(key, None)  # type: ignore[arg-type]
+    assert stored == key.bytes
+    assert len(stored) == 16
+    assert t.process_bind_param(str(key), None) == key.bytes  # type: ignore[arg-type]
+    assert t.process_result_value(stored, None) == key  # type: ignore[arg-type]
+
+
+async def test_get_by_id(exp_db: DbDriver):
+    async with exp_db.async_session() as sesh:
+        gater = Gater(blob="{}")
+        sesh.add(gater)
+        await sesh.commit()
+        gater_id = gater.id
+
+    assert _get_by_id_stmt(Gater) is _get_by_id_stmt(Gater)
+    async with exp_db.async_session() as sesh:
+        found = await Gater.get_by_id(sesh, gater_id)
+        assert found is not None
+        assert found.blob == "{}"
+        assert await Gater.get_by_id(sesh, primary_key()) is None
+
+
+async def test_disqualifier_outcome_raises_on_lazy_load(exp_db: DbDriver):
+    ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    async with exp_db.async_session() as sesh:
+        outcome = Outcome(
+            jurisdiction_id="jur1",
+            case_id="case1",
+            subject_id="sub1",
+            reviewer_id="rev1",
+            document_ids="[]",
+            review_type=ReviewType.blind,
+            decision=Decision.disqualify,
+            page_open_ts=ts,
+            decision_ts=ts,
+            disqualifiers=[OutcomeDisqualifiers(disqualifier=Disqualifier.other)],
+        )
+        sesh.add(outcome)
+        await sesh.commit()
+        outcome_id = outcome.id
+
+    async with exp_db.async_session() as sesh:
+        dq = (await sesh.execute(select(OutcomeDisqualifiers))).scalar_one()
+        with pytest.raises(InvalidRequestError):
+            _ = dq.outcome
+
+    async with exp_db.async_session() as sesh:
+        found = await Outcome.get_by_id(sesh, outcome_id)
+        assert found is not None
+        assert [d.disqualifier for d in found.disqualifiers] == [Disqualifier.other]
+        assert found.disqualifiers[0].outcome is found
+
+
+async def test_revocation_check(exp_db: DbDriver):
+    token_id = primary_key().hex
+    expires_at = datetime(2099, 1, 1, tzinfo=timezone.utc)
+    async with exp_db.async_session() as sesh:
+        assert await Revocation.check(sesh, token_id) is False
+        await Revocation.revoke(sesh, token_id, expires_at)
+        await sesh.commit()
+
+    async with exp_db.async_session() as sesh:
+        assert await Revocation.check(sesh, token_id) is True
+        assert await Revocation.check(sesh, primary_key().hex) is False
+
+
+async def test_warm_up_pool(exp_db: DbDriver):
+    await warm_up_pool(exp_db, 0)
+    await warm_up_pool(exp_db, 3)
+    # The pool is still usable afterwards.
+    async with exp_db.async_session() as sesh:
+        assert await Gater.get_by_id(sesh, primary_key()) is None
@@ -29,3 +29,14 @@ def test_role_enumerator_normalize():
     assert enumerator.next_mask("Accused ") == "Accused 4"
     assert enumerator.next_mask("judge") == "Judge 2"
     assert enumerator.next_mask("Judge") == "Judge 3"
+
+
+def test_role_enumerator_normalize_cached():
+    RoleEnumerator._key_from_role.cache_clear()
+    enumerator = RoleEnumerator()
+    enumerator.next_mask("judge")
+    enumerator.next_mask("judge")
+    RoleEnumerator().next_mask("judge")
+    info = RoleEnumerator._key_from_role.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
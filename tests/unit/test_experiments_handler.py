@@ -0,0 +1,48 @@
+import pytest
+
+from app.server.db import Decision, Disqualifier, ReviewType
+from app.server.generated.models import (
+    BlindChargingDecision,
+    DisqualifyingReason,
+    FinalChargingDecision,
+    ReviewProtocol,
+)
+from app.server.handlers.experiments import (
+    blind_decision_to_decision,
+    disqualifying_reason_to_disqualifier,
+    final_decision_to_decision,
+    review_protocol_to_review_type,
+)
+
+
+def test_enum_conversions_cover_every_member():
+    assert {review_protocol_to_review_type(p) for p in ReviewProtocol} == set(
+        ReviewType
+    )
+    assert {final_decision_to_decision(d) for d in FinalChargingDecision} == {
+        Decision.charge,
+        Decision.decline,
+    }
+    assert {disqualifying_reason_to_disqualifier(r) for r in DisqualifyingReason} == (
+        set(Disqualifier)
+    )
+
+
+def test_blind_decision_to_decision():
+    assert blind_decision_to_decision(BlindChargingDecision.CHARGE_LIKELY) == (
+        Decision.charge_likely
+    )
+    assert blind_decision_to_decision(BlindChargingDecision.CHARGE_MAYBE) == (
+        Decision.charge_maybe
+    )
+    assert blind_decision_to_decision(BlindChargingDecision.DECLINE_MAYBE) == (
+        Decision.decline_maybe
+    )
+    assert blind_decision_to_decision(BlindChargingDecision.DECLINE_LIKELY) == (
+        Decision.decline_likely
+    )
+
+
+def test_enum_conversion_unknown_value():
+    with pytest.raises(ValueError):
+        blind_decision_to_decision(FinalChargingDecision.CHARGE)  # type: ignore[arg-type]
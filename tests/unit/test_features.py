@@ -0,0 +1,33 @@
+from glowplug import DbDriver
+from sqlalchemy import update
+
+from app.server.db import Gater
+from app.server.features import _config_cache, _load_config_from_db
+
+
+async def test_load_config_from_db_cached(exp_db: DbDriver):
+    _config_cache.clear()
+    async with exp_db.async_session() as sesh:
+        gater = Gater(blob="v1", active=True)
+        sesh.add(gater)
+        await sesh.commit()
+        gater_id = gater.id
+
+    assert _load_config_from_db() == "v1"
+    assert len(_config_cache) == 1
+
+    # Rewriting the blob bumps `updated_at`, so the next load sees the change.
+    async with exp_db.async_session() as sesh:
+        await sesh.execute(update(Gater).where(Gater.id == gater_id).values(blob="v2"))
+        await sesh.commit()
+
+    assert _load_config_from_db() == "v2"
+    assert len(_config_cache) == 1
+
+    # Activating another config also invalidates the cache.
+    async with exp_db.async_session() as sesh:
+        await sesh.execute(update(Gater).where(Gater.active).values(active=False))
+        sesh.add(Gater(blob="v3", active=True))
+        await sesh.commit()
+
+    assert _load_config_from_db() == "v3"
@@ -0,0 +1,23 @@
+from types import SimpleNamespace
+
+from app.server.lazy import LazyObjectProxy
+
+
+def test_lazy_object_proxy():
+    calls = list[str]()
+
+    def load(value: str):
+        calls.append(value)
+        return SimpleNamespace(value=value)
+
+    proxy = LazyObjectProxy(load, "a")
+    assert not calls
+    assert proxy.value == "a"
+    assert proxy.value == "a"
+    assert calls == ["a"]
+    assert isinstance(proxy, LazyObjectProxy)
+
+    proxy._reset("b")
+    assert calls == ["a"]
+    assert proxy.value == "b"
+    assert calls == ["a", "b"]
@@ -1,6 +1,8 @@
+from types import SimpleNamespace
 from typing import cast
 from unittest.mock import MagicMock, patch
 
+import pytest
 from celery.result import AsyncResult
 from fakeredis import FakeRedis
 from fastapi.testclient import TestClient
@@ -350,3 +352,51 @@ async def test_redact_handler_multi_doc(
             b'"url": "https://test_document.pdf/"}, "targetBlobUrl": null}'
         ),
     ]
+
+
+@pytest.mark.parametrize(
+    "retry_state,detail",
+    [
+        (
+            {"name": "redact", "retries": "1", "exception": "boom"},
+            "name=redact, retries=1, exception=boom",
+        ),
+        (None, "unknown"),
+    ],
+)
+@patch("app.server.handlers.redaction.get_result")
+async def test_redaction_status_retry_detail(
+    get_result_mock: MagicMock,
+    api: TestClient,
+    exp_db: DbDriver,
+    fake_redis_store: FakeRedis,
+    retry_state: dict[str, str] | None,
+    detail: str,
+):
+    get_result_mock.return_value = SimpleNamespace(
+        id="retry_task_id", state="RETRY", name="redact"
+    )
+    fake_redis_store.hset("jur1:case1:task", "doc1", "retry_task_id")
+    if retry_state:
+        fake_redis_store.hset("retry_task_id:retry", mapping=retry_state)
+
+    response = api.get("/api/v1/redact/jur1/case1")
+    assert response.status_code == 200
+    assert response.json() == {
+        "caseId": "case1",
+        "jurisdictionId": "jur1",
+        "requests": [
+            {
+                "caseId": "case1",
+                "inputDocumentId": "doc1",
+                "jurisdictionId": "jur1",
+                "maskedSubjects": [],
+                "status": "PROCESSING",
+                "statusDetail": (
+                    "One step of the redaction job has failed "
+                    f"and is currently being retried. Detail: {detail}"
+                ),
+            },
+        ],
+    }
+    get_result_mock.assert_called_once_with("retry_task_id")